@@ -6,17 +6,14 @@
 """
 
 import random
-import threading
 import time
-from typing import List, TypedDict
+from typing import TypedDict
 
 from rich import box
 from rich.align import Align
-from rich.columns import Columns
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
 
@@ -321,6 +318,9 @@ class AnimatedEffects:
             "bright_magenta",
             "bright_cyan",
         ]
+        # Розмір термінала читаємо один раз, а не для кожного рядка кадру
+        width: int = int(self.console.size.width)
+        height: int = int(self.console.size.height)
 
         with Live(auto_refresh=False) as live:
             start_time = time.time()
@@ -329,16 +329,16 @@ class AnimatedEffects:
                 # Створюємо випадкові вибухи феєрверків
                 fireworks = []
                 for _ in range(random.randint(3, 8)):
-                    x = random.randint(10, self.console.size.width - 10)
-                    y = random.randint(3, self.console.size.height - 8)
+                    x = random.randint(10, width - 10)
+                    y = random.randint(3, height - 8)
                     char = random.choice(firework_chars)
                     color = random.choice(colors)
                     fireworks.append((x, y, char, color))
 
                 # Створюємо текстові лінії
                 lines = []
-                for y in range(self.console.size.height - 5):
-                    line: list[str] = [" "] * self.console.size.width
+                for y in range(height - 5):
+                    line: list[str] = [" "] * width
                     for fx, fy, char, color in fireworks:
                         if fy == y and 0 <= fx < len(line):
                             line[fx] = char
@@ -14,11 +14,38 @@
 - AddressBook - колекція контактів з пошуком
 """
 
+import calendar
 import json
 import re
 from collections import UserDict
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, TypedDict
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, TypedDict
+
+# Усе, крім цифр: для нормалізації номерів телефонів
+NON_DIGITS = re.compile(r"[^0-9]")
+# Дата у форматі DD.MM.YYYY; приймає ті самі варіанти, що й strptime("%d.%m.%Y")
+# (день і місяць з однієї цифри, день з пробілом попереду)
+BIRTHDAY_FORMAT = re.compile(r"( [1-9]|[0-9]{1,2})\.([0-9]{1,2})\.([0-9]{4})")
+
+
+def _digits_only(phone: str) -> str:
+    """
+    Повертає номер телефону без форматування (тільки цифри 0-9).
+
+    Номер, що вже складається лише з ASCII-цифр, повертається без виклику
+    регулярного виразу. Перевірка isascii потрібна, бо isdigit приймає
+    й інші цифри Unicode, які регулярний вираз відкидає.
+
+    Args:
+        phone: Номер телефону
+
+    Returns:
+        str: Рядок з цифр номера
+    """
+    if phone.isascii() and phone.isdigit():
+        return phone
+    return NON_DIGITS.sub("", phone)
 
 
 class Field:
@@ -29,6 +56,9 @@ class Field:
     Усі спеціалізовані поля наслідуються від цього класу.
     """
 
+    # Полів створюється по кілька на кожен контакт, тому обходимося без __dict__
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         """
         Ініціалізує поле зі значенням.
@@ -52,6 +82,8 @@ class Name(Field):
     - Автоматично обрізає пробіли
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Ініціалізує поле імені з валідацією.
@@ -74,8 +106,13 @@ class Phone(Field):
     Валідація:
     - Повинен містити рівно 10 цифр
     - Ігноруються всі не-цифрові символи при валідації
+
+    Атрибут digits зберігає номер без форматування (тільки цифри), щоб не
+    очищати його повторно при індексації та пошуку.
     """
 
+    __slots__ = ("digits",)
+
     def __init__(self, value: str) -> None:
         """
         Ініціалізує поле телефону з валідацією.
@@ -86,25 +123,13 @@ class Phone(Field):
         Raises:
             ValueError: Якщо номер не містить рівно 10 цифр
         """
-        if not self._validate_phone(value):
-            raise ValueError("Phone number must contain exactly 10 digits")
-        super().__init__(value)
-
-    @staticmethod
-    def _validate_phone(phone: str) -> bool:
-        """
-        Валідує формат номера телефону (рівно 10 цифр).
-
-        Args:
-            phone: Номер телефону для перевірки
-
-        Returns:
-            bool: True якщо номер валідний, False інакше
-        """
         # Видаляємо всі не-цифрові символи
-        clean_phone = re.sub(r"[^0-9]", "", phone)
+        digits = _digits_only(value)
         # Перевіряємо що залишилось рівно 10 цифр
-        return len(clean_phone) == 10 and clean_phone.isdigit()
+        if len(digits) != 10:
+            raise ValueError("Phone number must contain exactly 10 digits")
+        super().__init__(value)
+        self.digits = digits
 
 
 class Birthday(Field):
@@ -116,6 +141,8 @@ class Birthday(Field):
     - Повинен бути валідною датою
     """
 
+    __slots__ = ("date",)
+
     def __init__(self, value: str) -> None:
         """
         Ініціалізує поле дня народження з валідацією.
@@ -126,12 +153,19 @@ class Birthday(Field):
         Raises:
             ValueError: Якщо дата невалідна або у неправильному форматі
         """
+        # Розбираємо дату регулярним виразом і конструктором date замість
+        # strptime, який значно повільніший при масовому завантаженні
+        match = BIRTHDAY_FORMAT.fullmatch(value)
+        if match is None:
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+
+        day, month, year = match.groups()
         try:
-            # Парсимо дату та зберігаємо як date об'єкт
-            self.date = datetime.strptime(value, "%d.%m.%Y").date()
-            super().__init__(value)
+            # Зберігаємо як date об'єкт; date сам перевіряє, що така дата існує
+            self.date = date(int(year), int(month), int(day))
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        super().__init__(value)
 
 
 class ContactData(TypedDict):
@@ -160,10 +194,15 @@ class Record:
     - Пошук та редагування інформації
     """
 
+    # Фіксований набір атрибутів замість __dict__ зменшує розмір кожного запису
+    __slots__ = ("name", "phones", "birthday", "_phone_index")
+
     def __init__(self, name: str) -> None:
         self.name = Name(name)
         self.phones: List[Phone] = []
         self.birthday: Optional[Birthday] = None
+        # Індекс телефонів за нормалізованими цифрами для пошуку за O(1)
+        self._phone_index: Dict[str, Phone] = {}
 
     def add_phone(self, phone: str) -> None:
         """
@@ -179,16 +218,17 @@ class Record:
             ValueError: Якщо номер вже існує або має невалідний формат
         """
         phone_obj = Phone(phone)
-        if not self._phone_exists(phone_obj.value):
-            self.phones.append(phone_obj)
-        else:
+        digits = phone_obj.digits
+        if digits in self._phone_index:
             raise ValueError(f"Phone {phone} already exists for {self.name.value}")
+        self.phones.append(phone_obj)
+        self._phone_index[digits] = phone_obj
 
     def remove_phone(self, phone: str) -> None:
         """
         Видаляє номер телефону з запису.
 
-        Шукає номер телефону в списку та видаляє його.
+        Шукає номер телефону в індексі та видаляє його.
 
         Args:
             phone: Номер телефону для видалення
@@ -196,7 +236,7 @@ class Record:
         Raises:
             ValueError: Якщо номер не знайдено
         """
-        phone_obj = self.find_phone(phone)
+        phone_obj = self._phone_index.pop(self._normalize_phone(phone), None)
         if phone_obj:
             self.phones.remove(phone_obj)
         else:
@@ -215,22 +255,29 @@ class Record:
         Raises:
             ValueError: Якщо старий номер не знайдено або новий номер вже існує
         """
-        phone_obj = self.find_phone(old_phone)
+        old_digits = self._normalize_phone(old_phone)
+        phone_obj = self._phone_index.get(old_digits)
         if not phone_obj:
             raise ValueError(f"Phone {old_phone} not found for {self.name.value}")
 
         # Валідуємо новий номер перед зміною
         new_phone_obj = Phone(new_phone)
-        if self._phone_exists(new_phone_obj.value):
+        new_digits = new_phone_obj.digits
+        if new_digits in self._phone_index:
             raise ValueError(f"Phone {new_phone} already exists for {self.name.value}")
 
         phone_obj.value = new_phone_obj.value
+        phone_obj.digits = new_digits
+        # Переносимо запис індексу під новий ключ
+        del self._phone_index[old_digits]
+        self._phone_index[new_digits] = phone_obj
 
     def find_phone(self, phone: str) -> Optional[Phone]:
         """
         Знаходить номер телефону в записі.
 
         Порівнює номери телефонів ігноруючи форматування (дужки, тире, пробіли).
+        Пошук виконується через індекс нормалізованих номерів за O(1).
 
         Args:
             phone: Номер телефону для пошуку
@@ -238,11 +285,20 @@ class Record:
         Returns:
             Optional[Phone]: Об'єкт Phone якщо знайдено, None інакше
         """
-        clean_phone = re.sub(r"[^0-9]", "", phone)
-        for phone_obj in self.phones:
-            if re.sub(r"[^0-9]", "", phone_obj.value) == clean_phone:
-                return phone_obj
-        return None
+        return self._phone_index.get(self._normalize_phone(phone))
+
+    @staticmethod
+    def _normalize_phone(phone: str) -> str:
+        """
+        Повертає номер телефону без форматування (тільки цифри).
+
+        Args:
+            phone: Номер телефону
+
+        Returns:
+            str: Рядок з цифр номера, що використовується як ключ індексу
+        """
+        return _digits_only(phone)
 
     def _phone_exists(self, phone: str) -> bool:
         """
@@ -285,6 +341,34 @@ class Record:
             "birthday": self.birthday.value if self.birthday else None,
         }
 
+    @classmethod
+    def from_typed_dict(cls, data: ContactData) -> "Record":
+        """
+        Створює запис з TypedDict даних з повною валідацією полів.
+
+        Args:
+            data: Словник з даними контакту
+
+        Returns:
+            Record: Новий запис контакту
+
+        Raises:
+            KeyError: Якщо відсутнє ім'я контакту
+            ValueError: Якщо телефон або день народження невалідні
+        """
+        record = cls(data["name"])
+
+        # Додаємо телефони
+        for phone in data.get("phones", []):
+            record.add_phone(phone)
+
+        # Додаємо день народження якщо вказано
+        birthday = data.get("birthday")
+        if birthday:
+            record.add_birthday(birthday)
+
+        return record
+
 
 class AddressBook(UserDict[str, Record]):
     """
@@ -336,14 +420,17 @@ class AddressBook(UserDict[str, Record]):
         else:
             raise ValueError(f"Contact {name} not found")
 
-    def get_all_records(self) -> Dict[str, Record]:
+    def get_all_records(self) -> Mapping[str, Record]:
         """
         Отримує всі записи в адресній книзі.
 
+        Повертає представлення лише для читання без копіювання словника.
+        Якщо потрібна змінювана копія, використовуйте dict(book.get_all_records()).
+
         Returns:
-            Dict[str, Record]: Копія словника з усіма записами
+            Mapping[str, Record]: Словник з усіма записами лише для читання
         """
-        return self.data.copy()
+        return MappingProxyType(self.data)
 
     def to_typed_dict(self) -> Dict[str, ContactData]:
         """
@@ -385,17 +472,7 @@ class AddressBook(UserDict[str, Record]):
 
             for name, contact_data in data.items():
                 # Створюємо запис з даних контакту
-                record = Record(contact_data["name"])
-
-                # Додаємо телефони
-                for phone in contact_data.get("phones", []):
-                    record.add_phone(phone)
-
-                # Додаємо день народження якщо вказано
-                if contact_data.get("birthday"):
-                    record.add_birthday(contact_data["birthday"])
-
-                address_book.add_record(record)
+                address_book.add_record(Record.from_typed_dict(contact_data))
 
             return address_book
         except (json.JSONDecodeError, KeyError, ValueError) as e:
@@ -413,7 +490,15 @@ class AddressBook(UserDict[str, Record]):
         """
         try:
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(self.to_json())
+                # Пишемо JSON у файл потоково, без проміжного рядка з усією книгою;
+                # записи перетворюються у словники по одному через default
+                json.dump(
+                    self.data,
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                    default=Record.to_typed_dict,
+                )
             return True
         except (IOError, OSError) as e:
             print(f"Error saving address book to file: {e}")
@@ -460,33 +545,69 @@ class AddressBook(UserDict[str, Record]):
             - congratulation_date: дата для привітання (YYYY.MM.DD, з урахуванням переносу вихідних)
         """
         upcoming_birthdays: List[Dict[str, str]] = []
-        today = date.today()
+        window = self.birthday_window(days)
 
         for record in self.data.values():
-            if record.birthday:
-                birthday_this_year = record.birthday.date.replace(year=today.year)
-
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-                days_until_birthday = (birthday_this_year - today).days
-                if 0 <= days_until_birthday <= days:
-                    congratulation_date = birthday_this_year
-                    if birthday_this_year.weekday() >= 5:  # 5 = субота, 6 = неділя
-                        # Переносимо на наступний понеділок
-                        days_until_monday = 7 - birthday_this_year.weekday()
-                        congratulation_date = birthday_this_year + timedelta(
-                            days=days_until_monday
-                        )
-
-                    upcoming_birthdays.append(
-                        {
-                            "name": record.name.value,
-                            "birthday_date": birthday_this_year.strftime("%Y.%m.%d"),
-                            "congratulation_date": congratulation_date.strftime(
-                                "%Y.%m.%d"
-                            ),
-                        }
-                    )
+            if not record.birthday:
+                continue
+
+            birthday_date = record.birthday.date
+            birthday_this_year = window.get((birthday_date.month, birthday_date.day))
+            if birthday_this_year is None:
+                continue
+
+            upcoming_birthdays.append(
+                self.upcoming_birthday_entry(record.name.value, birthday_this_year)
+            )
 
         return upcoming_birthdays
+
+    @staticmethod
+    def birthday_window(days: int) -> Dict[Tuple[int, int], date]:
+        """
+        Будує таблицю (місяць, день) -> найближча дата для кожного дня вікна.
+
+        Таблиця будується один раз, щоб для кожного контакту виконувати лише
+        один пошук у словнику замість арифметики з датами. Перехід через Новий
+        рік враховується автоматично, бо дати вікна вже містять правильний рік.
+        Рік наперед покриває всі можливі дні, тому довші вікна обрізаються.
+        У невисокосному році день народження 29 лютого припадає на 28 лютого.
+
+        Args:
+            days: Кількість днів для перегляду вперед
+
+        Returns:
+            Dict[Tuple[int, int], date]: Найближча дата для кожного (місяць, день)
+        """
+        today = date.today()
+        window: Dict[Tuple[int, int], date] = {}
+        for offset in range(min(days, 366) + 1):
+            day = today + timedelta(days=offset)
+            window.setdefault((day.month, day.day), day)
+            if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+                window.setdefault((2, 29), day)
+        return window
+
+    @staticmethod
+    def upcoming_birthday_entry(name: str, birthday_this_year: date) -> Dict[str, str]:
+        """
+        Формує запис про найближчий день народження контакту.
+
+        Args:
+            name: Ім'я контакту
+            birthday_this_year: Найближча дата дня народження
+
+        Returns:
+            Dict[str, str]: Ім'я, дата дня народження та дата для привітання
+        """
+        congratulation_date = birthday_this_year
+        if birthday_this_year.weekday() >= 5:  # 5 = субота, 6 = неділя
+            # Переносимо на наступний понеділок
+            days_until_monday = 7 - birthday_this_year.weekday()
+            congratulation_date = birthday_this_year + timedelta(days=days_until_monday)
+
+        return {
+            "name": name,
+            "birthday_date": birthday_this_year.strftime("%Y.%m.%d"),
+            "congratulation_date": congratulation_date.strftime("%Y.%m.%d"),
+        }
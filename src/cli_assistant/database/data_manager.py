@@ -10,14 +10,20 @@ AddressBook та NotesManager з використанням JSON серіалі
 - Обробка помилок файлових операцій
 - Підтримка legacy форматів
 - Резервне копіювання даних
+- Журнал змін з періодичним злиттям у повний знімок
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .contact_models import AddressBook
-from .note_models import NotesManager
+from .contact_models import AddressBook, Record
+from .note_models import Note, NotesManager
+
+# Типи записів у журналі змін
+JOURNAL_CONTACT = "contact"
+JOURNAL_NOTE = "note"
 
 
 class DataManager:
@@ -34,8 +40,12 @@ class DataManager:
     - Завантаження нотаток з JSON файлу
     - Обробка помилок та винятків
     - Підтримка legacy форматів файлів
+    - Журнал змін: окремі зміни дописуються у файл замість повного перезапису
     """
 
+    # Кількість записів журналу, після якої він зливається у повний знімок
+    JOURNAL_COMPACTION_THRESHOLD = 100
+
     def __init__(
         self,
         contacts_filename: str = "addressbook.json",
@@ -66,29 +76,47 @@ class DataManager:
         self.contacts_filepath = Path(self.contacts_filename)
         self.notes_filepath = Path(self.notes_filename)
 
+        # Журнал змін зберігається поруч з файлом контактів:
+        # addressbook.json -> addressbook_journal.jsonl
+        self.journal_filepath = self.contacts_filepath.with_name(
+            self.contacts_filepath.stem + "_journal.jsonl"
+        )
+        # Кількість записів у журналі, обчислюється при першому зверненні
+        self._journal_size: Optional[int] = None
+
     def save_contacts(self, address_book: AddressBook) -> bool:
         """
         Save AddressBook data to file using JSON serialization.
 
+        The snapshot supersedes journaled contact changes, so they are dropped
+        from the journal after a successful save.
+
         Args:
             address_book (AddressBook): The AddressBook instance to save
 
         Returns:
             bool: True if save was successful, False otherwise
         """
-        return address_book.save_to_file(str(self.contacts_filepath))
+        if not address_book.save_to_file(str(self.contacts_filepath)):
+            return False
+        return self._drop_journal_entries(JOURNAL_CONTACT)
 
     def save_notes(self, notes_manager: NotesManager) -> bool:
         """
         Save NotesManager data to file using JSON serialization.
 
+        The snapshot supersedes journaled note changes, so they are dropped
+        from the journal after a successful save.
+
         Args:
             notes_manager (NotesManager): The NotesManager instance to save
 
         Returns:
             bool: True if save was successful, False otherwise
         """
-        return notes_manager.save_to_file(str(self.notes_filepath))
+        if not notes_manager.save_to_file(str(self.notes_filepath)):
+            return False
+        return self._drop_journal_entries(JOURNAL_NOTE)
 
     def save_data(
         self, address_book: AddressBook, notes_manager: Optional[NotesManager] = None
@@ -96,6 +124,9 @@ class DataManager:
         """
         Save both AddressBook and NotesManager data.
 
+        Each snapshot drops the journal entries it supersedes, so after saving
+        both contacts and notes the change journal is empty.
+
         Args:
             address_book (AddressBook): The AddressBook instance to save
             notes_manager (Optional[NotesManager]): The NotesManager instance to save
@@ -111,33 +142,268 @@ class DataManager:
 
         return contacts_saved and notes_saved
 
+    def append_journal(
+        self,
+        address_book: AddressBook,
+        notes_manager: NotesManager,
+        changes: Iterable[Tuple[str, str]],
+    ) -> bool:
+        """
+        Append the current state of changed records to the change journal.
+
+        Each change is a (type, key) pair, where type is JOURNAL_CONTACT or
+        JOURNAL_NOTE and key is the contact name or note ID. Records that no
+        longer exist are journaled as deletions. Once the journal grows past
+        JOURNAL_COMPACTION_THRESHOLD entries, a full snapshot is written instead.
+
+        Args:
+            address_book (AddressBook): The AddressBook holding current contacts
+            notes_manager (NotesManager): The NotesManager holding current notes
+            changes (Iterable[Tuple[str, str]]): Changed records to journal
+
+        Returns:
+            bool: True if the journal (or snapshot) was written, False otherwise
+        """
+        entries: List[Dict[str, Any]] = []
+        for entry_type, key in changes:
+            if entry_type == JOURNAL_CONTACT:
+                record = address_book.data.get(key)
+                entries.append(
+                    {
+                        "type": JOURNAL_CONTACT,
+                        "key": key,
+                        "data": record.to_typed_dict() if record else None,
+                    }
+                )
+            else:
+                note = notes_manager.data.get(key)
+                entries.append(
+                    {
+                        "type": JOURNAL_NOTE,
+                        "key": key,
+                        "data": note.to_typed_dict() if note else None,
+                        "next_id": notes_manager._next_id,
+                    }
+                )
+
+        if not entries:
+            return True
+
+        journal_size = self.get_journal_size()
+        try:
+            self._start_journal_line()
+            with open(self.journal_filepath, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except (IOError, OSError) as e:
+            print(f"Error writing journal file: {e}")
+            return False
+
+        self._journal_size = journal_size + len(entries)
+        if self._journal_size > self.JOURNAL_COMPACTION_THRESHOLD:
+            return self.save_data(address_book, notes_manager)
+        return True
+
+    def get_journal_size(self) -> int:
+        """
+        Get the number of entries in the change journal.
+
+        Returns:
+            int: Number of journal entries, or 0 if there is no journal
+        """
+        if self._journal_size is None:
+            self._journal_size = len(self._read_journal())
+        return self._journal_size
+
+    def clear_journal(self) -> bool:
+        """
+        Delete the change journal after its entries were merged into a snapshot.
+
+        Returns:
+            bool: True if the journal was removed or did not exist, False otherwise
+        """
+        try:
+            if self.journal_filepath.exists():
+                self.journal_filepath.unlink()
+            self._journal_size = 0
+            return True
+        except OSError as e:
+            print(f"Error deleting journal file: {e}")
+            return False
+
+    def _drop_journal_entries(self, entry_type: str) -> bool:
+        """
+        Remove entries of one type from the change journal.
+
+        Called after a snapshot of that type was written: older journal entries
+        would otherwise be replayed over the newer snapshot on load. The journal
+        file is deleted once no entries remain.
+
+        Args:
+            entry_type (str): JOURNAL_CONTACT or JOURNAL_NOTE
+
+        Returns:
+            bool: True if the journal was updated or did not exist, False otherwise
+        """
+        if not self.journal_filepath.exists():
+            self._journal_size = 0
+            return True
+
+        kept = [
+            entry for entry in self._read_journal() if entry.get("type") != entry_type
+        ]
+        if not kept:
+            return self.clear_journal()
+
+        try:
+            with open(self.journal_filepath, "w", encoding="utf-8") as f:
+                for entry in kept:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except (IOError, OSError) as e:
+            print(f"Error writing journal file: {e}")
+            return False
+
+        self._journal_size = len(kept)
+        return True
+
+    def _start_journal_line(self) -> None:
+        """
+        Make sure the next journal entry starts on a fresh line.
+
+        A crash in the middle of append_journal can leave the journal without
+        a trailing newline. Appending right after it would glue the next entry
+        to the broken line and both would be lost on load, so the broken line
+        is terminated first and later skipped by _read_journal.
+
+        Raises:
+            OSError: If the journal cannot be read or written
+        """
+        if not self.journal_filepath.exists():
+            return
+
+        with open(self.journal_filepath, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        Read all valid entries from the change journal.
+
+        Malformed lines are skipped: they can only be records that were cut
+        off while being written, and entries after them are still valid.
+
+        Returns:
+            List[Dict[str, Any]]: Journal entries in the order they were written
+        """
+        if not self.journal_filepath.exists():
+            return []
+
+        entries: List[Dict[str, Any]] = []
+        try:
+            with open(self.journal_filepath, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        print("Error parsing journal entry. Skipping it.")
+        except (IOError, OSError) as e:
+            print(f"Error reading journal file: {e}")
+        return entries
+
     def load_contacts(self) -> AddressBook:
         """
         Load AddressBook data from file using JSON deserialization.
 
+        Contact changes from the journal are replayed on top of the snapshot.
+
         Returns:
             AddressBook: Loaded AddressBook instance, or new empty one if file not found
         """
-        return AddressBook.load_from_file(str(self.contacts_filepath))
+        return self._load_contacts(self._read_journal())
+
+    def _load_contacts(self, journal: List[Dict[str, Any]]) -> AddressBook:
+        """
+        Load the contacts snapshot and replay contact changes from journal entries.
+
+        Args:
+            journal (List[Dict[str, Any]]): Entries already read from the journal
+
+        Returns:
+            AddressBook: Loaded AddressBook instance
+        """
+        address_book = AddressBook.load_from_file(str(self.contacts_filepath))
+        for entry in journal:
+            if entry.get("type") != JOURNAL_CONTACT:
+                continue
+            try:
+                if entry.get("data") is None:
+                    address_book.data.pop(entry["key"], None)
+                else:
+                    address_book.data[entry["key"]] = Record.from_typed_dict(
+                        entry["data"]
+                    )
+            except (KeyError, ValueError) as e:
+                print(f"Error replaying journal entry: {e}")
+        return address_book
 
     def load_notes(self) -> NotesManager:
         """
         Load NotesManager data from file using JSON deserialization.
 
+        Note changes from the journal are replayed on top of the snapshot.
+
         Returns:
             NotesManager: Loaded NotesManager instance, or new empty one if file not found
         """
-        return NotesManager.load_from_file(str(self.notes_filepath))
+        return self._load_notes(self._read_journal())
+
+    def _load_notes(self, journal: List[Dict[str, Any]]) -> NotesManager:
+        """
+        Load the notes snapshot and replay note changes from journal entries.
+
+        Args:
+            journal (List[Dict[str, Any]]): Entries already read from the journal
+
+        Returns:
+            NotesManager: Loaded NotesManager instance
+        """
+        notes_manager = NotesManager.load_from_file(str(self.notes_filepath))
+        for entry in journal:
+            if entry.get("type") != JOURNAL_NOTE:
+                continue
+            try:
+                if entry.get("data") is None:
+                    notes_manager.data.pop(entry["key"], None)
+                else:
+                    notes_manager.data[entry["key"]] = Note.from_typed_dict(
+                        entry["data"]
+                    )
+                notes_manager._next_id = max(
+                    notes_manager._next_id, entry.get("next_id", 0)
+                )
+            except (KeyError, ValueError) as e:
+                print(f"Error replaying journal entry: {e}")
+        return notes_manager
 
     def load_data(self) -> Tuple[AddressBook, NotesManager]:
         """
         Load both AddressBook and NotesManager data from files.
 
+        The change journal is read once and shared by both loaders.
+
         Returns:
             Tuple[AddressBook, NotesManager]: Loaded instances or new empty ones if files not found
         """
-        address_book = self.load_contacts()
-        notes_manager = self.load_notes()
+        journal = self._read_journal()
+        self._journal_size = len(journal)
+        address_book = self._load_contacts(journal)
+        notes_manager = self._load_notes(journal)
         return address_book, notes_manager
 
     def contacts_file_exists(self) -> bool:
@@ -16,11 +16,24 @@
 - Серіалізація в JSON
 """
 
+import heapq
 import json
-import re
 from collections import UserDict
 from datetime import datetime
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, Iterable, List, Optional, Set, TypedDict
+
+
+def now_timestamp() -> str:
+    """
+    Повертає поточний час у форматі "YYYY-MM-DD HH:MM:SS.ffffff".
+
+    isoformat дає той самий рядок, що й strftime("%Y-%m-%d %H:%M:%S.%f"),
+    але форматує дату приблизно вдвічі швидше.
+
+    Returns:
+        str: Мітка часу для created_at/updated_at
+    """
+    return datetime.now().isoformat(sep=" ", timespec="microseconds")
 
 
 class NoteData(TypedDict):
@@ -53,6 +66,9 @@ class Note:
     - Серіалізація в словник
     """
 
+    # Фіксований набір атрибутів замість __dict__ зменшує розмір кожної нотатки
+    __slots__ = ("title", "content", "tags", "_tags_lower", "created_at", "updated_at")
+
     def __init__(
         self, title: str, content: str = "", tags: Optional[List[str]] = None
     ) -> None:
@@ -73,27 +89,31 @@ class Note:
         self.title = title.strip()
         self.content = content
         self.tags = tags or []
+        # Множина тегів у нижньому регістрі для перевірки наявності за O(1)
+        self._tags_lower: Set[str] = {t.lower() for t in self.tags}
         # Зберігаємо дату та час створення нотатки у форматі з мікросекундами,
         # щоб точно зафіксувати момент створення
-        self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.created_at = now_timestamp()
         self.updated_at: Optional[str] = None
 
-    def update_content(self, content: str) -> None:
+    def update_content(self, content: str, timestamp: Optional[str] = None) -> None:
         """
         Оновлює зміст нотатки та встановлює часову мітку оновлення.
 
         Args:
             content: Новий зміст нотатки
+            timestamp: Мітка часу оновлення (за замовчуванням поточний час)
         """
         self.content = content
-        self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.updated_at = timestamp or now_timestamp()
 
-    def update_title(self, title: str) -> None:
+    def update_title(self, title: str, timestamp: Optional[str] = None) -> None:
         """
         Оновлює заголовок нотатки та встановлює часову мітку оновлення.
 
         Args:
             title: Новий заголовок нотатки
+            timestamp: Мітка часу оновлення (за замовчуванням поточний час)
 
         Raises:
             ValueError: Якщо заголовок пустий
@@ -102,9 +122,9 @@ class Note:
             raise ValueError("Note title cannot be empty")
 
         self.title = title.strip()
-        self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.updated_at = timestamp or now_timestamp()
 
-    def add_tag(self, tag: str) -> None:
+    def add_tag(self, tag: str, timestamp: Optional[str] = None) -> None:
         """
         Додає тег до нотатки.
 
@@ -113,13 +133,36 @@ class Note:
 
         Args:
             tag: Тег для додавання
+            timestamp: Мітка часу оновлення (за замовчуванням поточний час)
         """
         tag = tag.strip().lower()
-        if tag and tag not in [t.lower() for t in self.tags]:
+        if tag and tag not in self._tags_lower:
             self.tags.append(tag)
-            self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+            self._tags_lower.add(tag)
+            self.updated_at = timestamp or now_timestamp()
+
+    def add_tags(self, tags: Iterable[str], timestamp: Optional[str] = None) -> None:
+        """
+        Додає кілька тегів до нотатки за одну операцію.
 
-    def remove_tag(self, tag: str) -> None:
+        Працює як add_tag для кожного тега, але часова мітка зміни
+        обчислюється один раз, якщо було додано хоча б один тег.
+
+        Args:
+            tags: Теги для додавання
+            timestamp: Мітка часу оновлення (за замовчуванням поточний час)
+        """
+        added = False
+        for tag in tags:
+            tag = tag.strip().lower()
+            if tag and tag not in self._tags_lower:
+                self.tags.append(tag)
+                self._tags_lower.add(tag)
+                added = True
+        if added:
+            self.updated_at = timestamp or now_timestamp()
+
+    def remove_tag(self, tag: str, timestamp: Optional[str] = None) -> None:
         """
         Видаляє тег з нотатки.
 
@@ -128,13 +171,13 @@ class Note:
 
         Args:
             tag: Тег для видалення
+            timestamp: Мітка часу оновлення (за замовчуванням поточний час)
         """
         tag = tag.strip().lower()
-        original_tags = self.tags[:]
-        self.tags = [t for t in self.tags if t.lower() != tag]
-
-        if len(self.tags) != len(original_tags):
-            self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        if tag in self._tags_lower:
+            self.tags = [t for t in self.tags if t.lower() != tag]
+            self._tags_lower.discard(tag)
+            self.updated_at = timestamp or now_timestamp()
 
     def has_tag(self, tag: str) -> bool:
         """
@@ -148,8 +191,7 @@ class Note:
         Returns:
             bool: True якщо тег знайдено, False інакше
         """
-        tag = tag.strip().lower()
-        return tag in [t.lower() for t in self.tags]
+        return tag.strip().lower() in self._tags_lower
 
     def search_in_content(self, query: str) -> bool:
         """
@@ -163,11 +205,11 @@ class Note:
         Returns:
             bool: True якщо запит знайдено, False інакше
         """
-        query = query.lower()
+        query = query.casefold()
         return (
-            query in self.title.lower()
-            or query in self.content.lower()
-            or any(query in tag.lower() for tag in self.tags)
+            query in self.title.casefold()
+            or query in self.content.casefold()
+            or any(query in tag.casefold() for tag in self.tags)
         )
 
     def __str__(self) -> str:
@@ -210,6 +252,7 @@ class Note:
         note.content = data["content"]
         # Копіюємо список тегів з даних, щоб оригінальні дані залишалися незмінними
         note.tags = data["tags"][:]
+        note._tags_lower = {t.lower() for t in note.tags}
         note.created_at = data["created_at"]
         note.updated_at = data.get("updated_at")
         return note
@@ -342,11 +385,13 @@ class NotesManager(UserDict[str, Note]):
         Returns:
             Dict[str, Note]: Словник з ID нотаток як ключами та об'єктами Note як значеннями
         """
-        results = {}
-        for note_id, note in self.data.items():
-            if note.has_tag(tag):
-                results[note_id] = note
-        return results
+        # Нормалізуємо тег один раз, а не для кожної нотатки
+        tag = tag.strip().lower()
+        return {
+            note_id: note
+            for note_id, note in self.data.items()
+            if tag in note._tags_lower
+        }
 
     def get_all_tags(self) -> List[str]:
         """
@@ -358,17 +403,19 @@ class NotesManager(UserDict[str, Note]):
         Returns:
             List[str]: Відсортований список унікальних тегів
         """
-        all_tags: set[str] = set()
+        all_tags: Set[str] = set()
         for note in self.data.values():
-            all_tags.update(tag.lower() for tag in note.tags)
-        return sorted(list(all_tags))
+            # Теги кожної нотатки вже зберігаються в нижньому регістрі
+            all_tags.update(note._tags_lower)
+        return sorted(all_tags)
 
     def get_recent_notes(self, limit: int = 10) -> Dict[str, Note]:
         """
         Отримує найновіші нотатки (створені або оновлені).
 
         Сортування виконується за часом останнього оновлення, якщо він є,
-        або за часом створення, якщо оновлень не було.
+        або за часом створення, якщо оновлень не було. Відбираються лише
+        limit найновіших нотаток без сортування всього списку.
 
         Args:
             limit: Максимальна кількість нотаток для повернення (за замовчуванням 10)
@@ -380,11 +427,11 @@ class NotesManager(UserDict[str, Note]):
         def get_latest_time(note: Note) -> str:
             return note.updated_at or note.created_at
 
-        sorted_items = sorted(
-            self.data.items(), key=lambda x: get_latest_time(x[1]), reverse=True
+        recent_items = heapq.nlargest(
+            limit, self.data.items(), key=lambda x: get_latest_time(x[1])
         )
 
-        return dict(sorted_items[:limit])
+        return dict(recent_items)
 
     def to_typed_dict(self) -> Dict[str, NoteData]:
         """
@@ -457,7 +504,12 @@ class NotesManager(UserDict[str, Note]):
         """
         try:
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(self.to_json())
+                # Пишемо JSON у файл потоково, без проміжного рядка з усіма нотатками;
+                # нотатки перетворюються у словники по одному через default
+                data = {"notes": self.data, "next_id": self._next_id}
+                json.dump(
+                    data, f, indent=2, ensure_ascii=False, default=Note.to_typed_dict
+                )
             return True
         except (IOError, OSError) as e:
             print(f"Error saving notes to file: {e}")
@@ -501,16 +553,12 @@ class NotesManager(UserDict[str, Note]):
         max_id = 0
 
         for note_id, note_data in data.items():
-            note = Note.from_typed_dict(note_data)
-            self.data[note_id] = note
-
-            # Виділяємо числову частину з ідентифікатора (після "note_"),
-            # щоб зберегти правильну послідовність для наступного ID
-            if note_id.startswith("note_"):
-                try:
-                    id_num = int(note_id.split("_")[1])
-                    max_id = max(max_id, id_num)
-                except (IndexError, ValueError):
-                    pass
+            self.data[note_id] = Note.from_typed_dict(note_data)
+
+            # Виділяємо числову частину з ідентифікатора (після "note_") зрізом,
+            # без split і винятків, щоб зберегти правильну послідовність ID
+            id_num = note_id[5:]
+            if note_id.startswith("note_") and id_num.isascii() and id_num.isdigit():
+                max_id = max(max_id, int(id_num))
 
         self._next_id = max_id + 1
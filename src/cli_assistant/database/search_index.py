@@ -0,0 +1,129 @@
+"""
+Інвертований індекс триграм для швидкого пошуку підрядків.
+
+Цей модуль містить допоміжну структуру, яка дозволяє знаходити записи,
+що містять заданий підрядок, без повного перебору всіх записів.
+
+Принцип роботи:
+- Кожен текст розбивається на триграми (усі підрядки довжиною 3 символи)
+- Для кожної триграми зберігається множина ключів записів, що її містять
+- Для запиту перетинаються множини всіх його триграм, що дає кандидатів
+- Кандидатів необхідно перевірити точним порівнянням, бо збіг триграм
+  не гарантує наявності всього підрядка
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+# Мінімальна довжина запиту, для якої індекс може звузити пошук
+TRIGRAM_SIZE = 3
+
+
+class TrigramIndex:
+    """
+    Інвертований індекс триграм: триграма -> множина ключів записів.
+
+    Можливості:
+    - Індексація кількох текстів під одним ключем (наприклад, ім'я та телефони)
+    - Повторна індексація ключа зі збереженням його початкового порядку
+    - Видалення ключа без необхідності передавати старий текст
+    - Отримання кандидатів у порядку першого додавання ключів
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._key_trigrams: Dict[str, Set[str]] = {}
+        # Порядкові номери ключів для стабільного порядку результатів
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """
+        Повертає множину всіх триграм тексту.
+
+        Args:
+            text: Текст для розбиття (вже нормалізований викликачем)
+
+        Returns:
+            Set[str]: Множина підрядків довжиною TRIGRAM_SIZE
+        """
+        return {text[i : i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+    def add(self, key: str, texts: Iterable[str]) -> None:
+        """
+        Індексує тексти під заданим ключем, замінюючи попередні дані ключа.
+
+        Args:
+            key: Ключ запису (наприклад, ім'я контакту)
+            texts: Нормалізовані тексти запису для індексації
+        """
+        self._discard_postings(key)
+
+        grams: Set[str] = set()
+        for text in texts:
+            grams |= self.trigrams(text)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+        self._key_trigrams[key] = grams
+
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Видаляє ключ з індексу. Відсутній ключ ігнорується.
+
+        Args:
+            key: Ключ запису для видалення
+        """
+        self._discard_postings(key)
+        self._key_trigrams.pop(key, None)
+        self._order.pop(key, None)
+
+    def candidates(self, query: str) -> Optional[List[str]]:
+        """
+        Повертає ключі записів, що можуть містити запит.
+
+        Args:
+            query: Нормалізований пошуковий запит
+
+        Returns:
+            Optional[List[str]]: Ключі-кандидати у порядку додавання або None,
+            якщо запит закороткий для використання індексу
+        """
+        if len(query) < TRIGRAM_SIZE:
+            return None
+
+        # Перетинаємо з найменшої множини, щоб швидше відсікти зайві ключі
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in self.trigrams(query)),
+            key=len,
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return self.sort_keys(result)
+
+    def sort_keys(self, keys: Iterable[str]) -> List[str]:
+        """
+        Впорядковує проіндексовані ключі за порядком їх першого додавання.
+
+        Args:
+            keys: Ключі, присутні в індексі
+
+        Returns:
+            List[str]: Ключі у порядку додавання
+        """
+        return sorted(keys, key=self._order.__getitem__)
+
+    def _discard_postings(self, key: str) -> None:
+        """Видаляє ключ з усіх списків триграм, у яких він присутній."""
+        for gram in self._key_trigrams.get(key, ()):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
@@ -4,17 +4,14 @@ Enhanced visual effects with faster animations and better error handling.
 
 import random
 import time
+from functools import lru_cache
+from itertools import cycle
 from typing import List, Optional
 
-import pyfiglet  # type: ignore
-from art import text2art  # type: ignore
-from halo import Halo  # type: ignore
 from rich import box
 from rich.align import Align
 from rich.columns import Columns
 from rich.console import Console
-from rich.layout import Layout
-from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -28,6 +25,21 @@ from rich.table import Table
 from rich.text import Text
 
 
+@lru_cache(maxsize=64)
+def _figlet_title(text: str, font: str) -> Optional[str]:
+    """Render a figlet title, caching the result; None if pyfiglet fails."""
+    # Imported here rather than at module level: pyfiglet is slow to load
+    import pyfiglet  # type: ignore
+
+    try:
+        return str(pyfiglet.figlet_format(text, font=font))
+    except Exception:
+        try:
+            return str(pyfiglet.figlet_format(text))  # Use default font
+        except Exception:
+            return None
+
+
 class EnhancedVisualEffects:
     """Enhanced visual effects class with better error handling."""
 
@@ -53,13 +65,9 @@ class EnhancedVisualEffects:
 
     def create_ascii_title(self, text: str, font: str = "big") -> str:
         """Create ASCII title with fallback."""
-        try:
-            return str(pyfiglet.figlet_format(text, font=font))
-        except Exception:
-            try:
-                return str(pyfiglet.figlet_format(text))  # Use default font
-            except Exception:
-                pass
+        title = _figlet_title(text, font)
+        if title is not None:
+            return title
 
         # Fallback: create simple ASCII art
         return self._create_simple_ascii(text)
@@ -99,9 +107,8 @@ class EnhancedVisualEffects:
             "bright_magenta",
         ]
 
-        for i, line in enumerate(lines):
+        for line, color in zip(lines, cycle(color_sequence)):
             if line.strip():  # If line is not empty
-                color = color_sequence[i % len(color_sequence)]
                 colored_lines.append(Text(line, style=f"bold {color}"))
             else:
                 colored_lines.append(Text(line))
@@ -140,6 +147,8 @@ class EnhancedVisualEffects:
     ) -> None:
         """Display loading animation with fallback."""
         try:
+            from halo import Halo  # type: ignore
+
             spinner_styles = ["dots", "line", "pipe", "simpleDots"]
             spinner = Halo(
                 text=text, spinner=random.choice(spinner_styles), color="cyan"
@@ -170,14 +179,11 @@ class EnhancedVisualEffects:
 
     def create_rainbow_text(self, text: str) -> Text:
         """Create text with rainbow colors."""
-        rainbow_text = Text()
         colors = ["red", "bright_red", "yellow", "green", "cyan", "blue", "magenta"]
 
-        for i, char in enumerate(text):
-            color = colors[i % len(colors)]
-            rainbow_text.append(char, style=f"bold {color}")
-
-        return rainbow_text
+        return Text.assemble(
+            *((char, f"bold {color}") for char, color in zip(text, cycle(colors)))
+        )
 
     def display_success_message(self, message: str) -> None:
         """Display success message with effects."""
@@ -229,10 +235,9 @@ class EnhancedVisualEffects:
         """Display celebration animation."""
         celebration_symbols = ["🎉", "🎊", "✨", "🌟", "💫"]
 
-        for _ in range(2):  # Faster animation
-            symbols = " ".join(random.choices(celebration_symbols, k=8))
-            self.console.print(Align.center(Text(symbols, style="bright_yellow")))
-            time.sleep(0.2)  # Faster timing
+        # Print both rows of symbols in one call, without pausing between them
+        lines = [" ".join(random.choices(celebration_symbols, k=8)) for _ in range(2)]
+        self.console.print(Align.center(Text("\n".join(lines), style="bright_yellow")))
 
     def create_fancy_table_style(self, table: Table) -> Table:
         """Apply beautiful style to table."""
@@ -98,9 +98,9 @@ class FunctionExecutor:
             # Виконуємо функцію
             result = self._execute_function(function_name, arguments)
 
-            # Зберігаємо дані після успішних операцій
+            # Зберігаємо незбережені зміни після успішних операцій
             if result.success:
-                self.operations.save_data()
+                self.operations.flush()
 
             return str(result)
 
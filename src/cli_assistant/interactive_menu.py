@@ -14,8 +14,9 @@
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 import questionary
 from questionary import Style
@@ -76,9 +77,6 @@ class InteractiveMenu:
         # Ініціалізуємо покращені візуальні ефекти
         self.effects = EnhancedVisualEffects(self.console)
 
-        # Ініціалізуємо менеджер операцій (Singleton)
-        self.operations = OperationsManager.get_instance()
-
         # Кастомний стиль для questionary (темна тема з кольорами)
         self.custom_style = Style(
             [
@@ -94,8 +92,16 @@ class InteractiveMenu:
             ]
         )
 
-        # Показуємо стартову анімацію
-        self.effects.display_startup_sequence("CLI Assistant")
+        # Ініціалізуємо менеджер операцій (Singleton) у фоновому потоці:
+        # завантаження даних перекривається стартовою анімацією, а не
+        # додається до неї. result() повторно піднімає помилку завантаження.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loading = executor.submit(OperationsManager.get_instance)
+
+            # Показуємо стартову анімацію
+            self.effects.display_startup_sequence("CLI Assistant")
+
+            self.operations = loading.result()
 
         # Показуємо кількість завантажених даних при старті
         data_summary = self.operations.get_data_summary()
@@ -122,7 +128,9 @@ class InteractiveMenu:
         self.effects.create_gradient_rule("🌟 MAIN MENU 🌟")
         self.console.print()
 
-    def display_contacts_table(self, records: Optional[List[Record]] = None) -> None:
+    def display_contacts_table(
+        self, records: Optional[Collection[Record]] = None
+    ) -> None:
         """Display contacts in an interactive table with search and mouse support."""
         if records is None:
             records = self.operations.get_all_contacts()
@@ -165,7 +173,7 @@ class InteractiveMenu:
             )
             self._display_fallback_contacts_table(records)
 
-    def _display_fallback_contacts_table(self, records: List[Record]) -> None:
+    def _display_fallback_contacts_table(self, records: Collection[Record]) -> None:
         """Fallback method for displaying contacts table."""
         # Create beautiful table with enhanced style
         table = Table(
@@ -13,14 +13,31 @@
 """
 
 import os
-import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    ValuesView,
+)
 
 # Імпорти моделей та менеджерів даних
-from .database.contact_models import AddressBook, Record
-from .database.data_manager import DataManager
-from .database.note_models import Note, NotesManager
+from .database.contact_models import NON_DIGITS, AddressBook, Record
+from .database.data_manager import JOURNAL_CONTACT, JOURNAL_NOTE, DataManager
+from .database.note_models import Note, NotesManager, now_timestamp
+from .database.search_index import TrigramIndex
+
+# Символи, з яких складається запит у формі номера телефону ("+380", "(555) 12")
+PHONE_QUERY_CHARS = frozenset("0123456789+-() ")
 
 
 class OperationsManager:
@@ -43,6 +60,9 @@ class OperationsManager:
     _instance = None
     _initialized = False
 
+    # Кількість останніх запитів global_search, результати яких зберігаються
+    SEARCH_CACHE_SIZE = 128
+
     def __new__(cls) -> "OperationsManager":
         """
         Створює новий екземпляр або повертає існуючий (Singleton pattern).
@@ -69,6 +89,47 @@ class OperationsManager:
         self.data_manager = DataManager()
         self.address_book, self.notes_manager = self.data_manager.load_data()
 
+        # Незбережені зміни (тип, ключ) у порядку появи та режим автозбереження
+        self._pending: Dict[Tuple[str, str], None] = {}
+        self._autosave = True
+        # Спільна мітка часу змін усередині batch(); None поза блоком
+        self._batch_timestamp: Optional[str] = None
+
+        # Лічильники статистики підтримуються інкрементально в методах зміни даних
+        self._stats: Dict[str, int] = {}
+
+        # Пошукові індекси: триграми імен і телефонів контактів та теги нотаток.
+        # Пошукові структури контактів будуються ліниво при першому зверненні,
+        # щоб запуск для кількох простих команд не платив за індексацію всіх
+        self._contact_index_ready = False
+        self._contact_index = TrigramIndex()
+        # Нормалізовані тексти контактів для перевірки збігів: ім'я ->
+        # (ім'я після casefold, телефони та їх цифри, кожні через "\x00")
+        self._contact_search_text: Dict[str, Tuple[str, str, str]] = {}
+        # Спільний буфер тексту нотаток для пошуку одним проходом:
+        # (текст, зміщення початку кожної нотатки, ID нотаток). Будується
+        # ліниво при пошуку та скидається при будь-якій зміні нотаток
+        self._notes_search_buffer: Optional[Tuple[str, List[int], List[str]]] = None
+        # Тег -> множина ID нотаток
+        self._tag_index: Dict[str, Set[str]] = {}
+        # Дні народження контактів: (місяць, день) -> множина імен
+        self._birthday_index: Dict[Tuple[int, int], Set[str]] = {}
+        # Порядкові номери контактів у адресній книзі: дозволяють впорядкувати
+        # кілька знайдених імен без перебору всієї книги
+        self._contact_order: Dict[str, int] = {}
+        self._next_contact_order = 0
+        # Порядкові номери нотаток: результати пошуку за тегом повертаються
+        # в порядку створення нотаток, а не в порядку додавання тегу
+        self._note_order: Dict[str, int] = {}
+        self._next_note_order = 0
+
+        # Лічильники та індекси заповнюються одним спільним проходом по даних
+        self._rebuild_indexes()
+
+        # Результати останніх глобальних пошуків (LRU), скидаються при змінах
+        self._search_cache: "OrderedDict[str, Tuple[List[Record], Dict[str, Note]]]"
+        self._search_cache = OrderedDict()
+
         # Помічаємо що ініціалізація завершена
         OperationsManager._initialized = True
 
@@ -86,14 +147,235 @@ class OperationsManager:
 
     def save_data(self) -> bool:
         """
-        Зберігає всі дані на диск.
+        Зберігає повний знімок всіх даних на диск.
 
         Returns:
             bool: True якщо збереження успішне, False інакше
         """
         result = self.data_manager.save_data(self.address_book, self.notes_manager)
+        if result:
+            self._pending.clear()
         return bool(result)
 
+    def flush(self) -> bool:
+        """
+        Дописує незбережені зміни у журнал змін на диску.
+
+        Записуються лише змінені контакти та нотатки, тому вартість збереження
+        не залежить від розміру всіх даних. DataManager періодично зливає
+        журнал у повний знімок.
+
+        Returns:
+            bool: True якщо змін немає або збереження успішне, False інакше
+        """
+        if not self._pending:
+            return True
+        if not self.data_manager.append_journal(
+            self.address_book, self.notes_manager, self._pending
+        ):
+            return False
+        self._pending.clear()
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator["OperationsManager"]:
+        """
+        Групує кілька операцій в одне збереження на диск.
+
+        Усередині блоку операції лише позначають дані як змінені,
+        а запис на диск виконується один раз при виході з блоку.
+        Усі зміни блоку отримують одну мітку часу, зафіксовану при вході.
+
+        Приклад:
+            with operations.batch():
+                operations.add_contact("John", ["1234567890"])
+                operations.add_note("Call John")
+
+        Yields:
+            OperationsManager: Цей же менеджер операцій
+        """
+        previous_autosave = self._autosave
+        previous_timestamp = self._batch_timestamp
+        self._autosave = False
+        if previous_timestamp is None:
+            self._batch_timestamp = now_timestamp()
+        try:
+            yield self
+        finally:
+            self._autosave = previous_autosave
+            self._batch_timestamp = previous_timestamp
+            if previous_autosave:
+                self.flush()
+
+    def _timestamp(self) -> str:
+        """
+        Повертає мітку часу для зміни даних.
+
+        Формат збігається з мітками, які ставить сама нотатка
+        ("YYYY-MM-DD HH:MM:SS.ffffff").
+
+        Returns:
+            str: Мітка часу поточного batch() або поточний час
+        """
+        if self._batch_timestamp is not None:
+            return self._batch_timestamp
+        return now_timestamp()
+
+    def _mark_dirty(self, entry_type: str, key: str) -> bool:
+        """
+        Позначає запис як змінений та зберігає зміни, якщо увімкнено автозбереження.
+
+        Args:
+            entry_type: Тип запису (JOURNAL_CONTACT або JOURNAL_NOTE)
+            key: Ім'я контакту або ідентифікатор нотатки
+
+        Returns:
+            bool: Результат збереження або True, якщо збереження відкладено
+        """
+        self._pending[(entry_type, key)] = None
+        # Будь-яка зміна даних робить збережені результати пошуку застарілими
+        self._search_cache.clear()
+        if self._autosave:
+            return self.flush()
+        return True
+
+    def _rebuild_indexes(self) -> None:
+        """
+        Будує пошукові індекси та лічильники статистики по завантажених даних.
+
+        Кожен контакт і кожна нотатка відвідуються лише один раз: індексація
+        та підрахунок виконуються в тому самому циклі. Надалі індекси та
+        лічильники оновлюються інкрементально в методах зміни даних.
+        """
+        with_birthdays = with_phones = with_tags = 0
+        for name, record in self.address_book.data.items():
+            self._add_contact_order(name)
+            if record.birthday:
+                with_birthdays += 1
+                self._index_birthday(record)
+            if record.phones:
+                with_phones += 1
+        for note_id, note in self.notes_manager.data.items():
+            self._add_note_order(note_id)
+            if note.tags:
+                with_tags += 1
+                self._index_note_tags(note_id, note.tags)
+
+        self._stats = {
+            "contacts_with_birthdays": with_birthdays,
+            "contacts_with_phones": with_phones,
+            "notes_with_tags": with_tags,
+        }
+
+    def _add_contact_order(self, name: str) -> None:
+        """
+        Призначає контакту наступний порядковий номер у адресній книзі.
+
+        Args:
+            name: Ім'я контакту, доданого в кінець адресної книги
+        """
+        self._contact_order[name] = self._next_contact_order
+        self._next_contact_order += 1
+
+    def _add_note_order(self, note_id: str) -> None:
+        """
+        Призначає нотатці наступний порядковий номер.
+
+        Args:
+            note_id: Ідентифікатор нотатки, доданої в кінець списку нотаток
+        """
+        self._note_order[note_id] = self._next_note_order
+        self._next_note_order += 1
+
+    def _ensure_contact_index(self) -> None:
+        """
+        Будує пошукові структури контактів, якщо вони ще не побудовані.
+
+        До першого пошуку зміни контактів не індексуються: індекс будується
+        з поточних даних і тому вже враховує їх.
+        """
+        if self._contact_index_ready:
+            return
+        self._contact_index_ready = True
+        for record in self.address_book.data.values():
+            self._index_contact(record)
+
+    def _index_contact(self, record: Record) -> None:
+        """
+        Індексує ім'я (зведене через casefold) та телефони контакту.
+
+        Args:
+            record: Запис контакту для індексації
+        """
+        if not self._contact_index_ready:
+            return
+        name_folded = record.name.value.casefold()
+        phone_values = [phone.value for phone in record.phones]
+        phone_digits = [phone.digits for phone in record.phones]
+        self._contact_index.add(
+            record.name.value, [name_folded, *phone_values, *phone_digits]
+        )
+        # Роздільник "\x00" не дає запиту збігтися на стику двох телефонів
+        self._contact_search_text[record.name.value] = (
+            name_folded,
+            "\x00".join(phone_values),
+            "\x00".join(phone_digits),
+        )
+
+    def _index_birthday(self, record: Record) -> None:
+        """
+        Додає контакт до індексу днів народження.
+
+        Args:
+            record: Запис контакту з встановленим днем народження
+        """
+        if record.birthday:
+            birthday = record.birthday.date
+            key = (birthday.month, birthday.day)
+            self._birthday_index.setdefault(key, set()).add(record.name.value)
+
+    def _unindex_birthday(self, record: Record) -> None:
+        """
+        Видаляє контакт з індексу днів народження.
+
+        Args:
+            record: Запис контакту
+        """
+        if record.birthday:
+            birthday = record.birthday.date
+            key = (birthday.month, birthday.day)
+            names = self._birthday_index.get(key)
+            if names is not None:
+                names.discard(record.name.value)
+                if not names:
+                    del self._birthday_index[key]
+
+    def _index_note_tags(self, note_id: str, tags: List[str]) -> None:
+        """
+        Додає нотатку до індексу тегів.
+
+        Args:
+            note_id: Ідентифікатор нотатки
+            tags: Теги нотатки
+        """
+        for tag in tags:
+            self._tag_index.setdefault(tag.lower(), set()).add(note_id)
+
+    def _unindex_note_tags(self, note_id: str, tags: List[str]) -> None:
+        """
+        Видаляє нотатку з індексу тегів.
+
+        Args:
+            note_id: Ідентифікатор нотатки
+            tags: Теги нотатки, під якими вона була проіндексована
+        """
+        for tag in tags:
+            note_ids = self._tag_index.get(tag.lower())
+            if note_ids is not None:
+                note_ids.discard(note_id)
+                if not note_ids:
+                    del self._tag_index[tag.lower()]
+
     def get_data_summary(self) -> Dict[str, int]:
         """
         Отримує зведення завантажених даних.
@@ -131,16 +413,17 @@ class OperationsManager:
             birthday: День народження у форматі DD.MM.YYYY (опціонально)
 
         Returns:
-            Dict з результатом операції:
+            Dict[str, Any] з результатом операції:
             - success: bool - чи успішна операція
             - message: str - повідомлення про результат
             - existing: bool - чи контакт вже існує (опціонально)
             - record: Record - створений запис (опціонально)
         """
         try:
-            # Перевіряємо чи контакт з таким ім'ям вже існує
-            existing_record = self.address_book.find(name)
-            if existing_record:
+            # Перевіряємо чи контакт з таким ім'ям вже існує. Ключем адресної
+            # книги є ім'я без пробілів по краях (як його зберігає Name), тож
+            # перевіряємо саме його, інакше "John " перезаписав би "John"
+            if name.strip() in self.address_book.data:
                 return {
                     "success": False,
                     "message": f"Contact '{name}' already exists",
@@ -175,9 +458,16 @@ class OperationsManager:
 
             # Додаємо запис до адресної книги
             self.address_book.add_record(record)
+            self._add_contact_order(record.name.value)
+            self._index_contact(record)
+            self._index_birthday(record)
+            if record.birthday:
+                self._stats["contacts_with_birthdays"] += 1
+            if record.phones:
+                self._stats["contacts_with_phones"] += 1
 
             # Зберігаємо дані в файл
-            save_success = self.save_data()
+            save_success = self._mark_dirty(JOURNAL_CONTACT, record.name.value)
             if not save_success:
                 return {
                     "success": False,
@@ -201,39 +491,95 @@ class OperationsManager:
         1. Частковий збіг з ім'ям контакту (регістр ігнорується)
         2. Частковий збіг з будь-яким номером телефону
 
+        Запит у формі номера телефону (цифри та "+-() ") порівнюється з цифрами
+        номерів, тож форматування в запиті та в збережених номерах не заважає.
+
         Args:
             query: Рядок для пошуку
 
         Returns:
             List[Record]: Список контактів що відповідають критеріям пошуку
         """
-        # Перетворюємо запит в нижній регістр для пошуку без урахування регістру
-        query = query.lower()
+        self._ensure_contact_index()
+        if PHONE_QUERY_CHARS.issuperset(query) and NON_DIGITS.sub("", query):
+            return self._search_contacts_by_phone(query)
+
+        # Зводимо регістр запиту через casefold: на відміну від lower() це коректно
+        # порівнює й символи на кшталт "ß" та "ẞ", а не лише ASCII і кирилицю
+        query = query.casefold()
         results = []
 
-        # Проходимо по всіх записах в адресній книзі
-        for record in self.address_book.data.values():
-            # Шукаємо збіг в імені
-            if query in record.name.value.lower():
-                results.append(record)
-                continue  # Переходимо до наступного запису
+        # Для запитів від трьох символів звужуємо перебір кандидатами з індексу
+        # триграм; кандидатів все одно перевіряємо точним порівнянням нижче
+        candidates = self._contact_index.candidates(query)
+        names = self._contact_search_text if candidates is None else candidates
 
-            # Шукаємо збіг в номерах телефонів
-            for phone in record.phones:
-                if query in phone.value:
-                    results.append(record)
-                    break  # Виходимо з циклу телефонів, додаємо запис тільки один раз
+        # Порівнюємо із заздалегідь нормалізованими текстами, щоб не зводити
+        # регістр імені кожного контакту при кожному запиті
+        for name in names:
+            name_folded, phones, _ = self._contact_search_text[name]
+            # Шукаємо збіг в імені або в будь-якому з номерів телефонів
+            if query in name_folded or query in phones:
+                results.append(self.address_book.data[name])
 
         return results
 
-    def get_all_contacts(self) -> List[Record]:
+    def _search_contacts_by_phone(self, query: str) -> List[Record]:
+        """
+        Шукає контакти за запитом у формі номера телефону.
+
+        Номери порівнюються лише за цифрами, а ім'я — з самим запитом, бо ім'я
+        теж може містити такий фрагмент. На відміну від звичайного пошуку
+        підрядка, форматування з обох боків ігнорується: запит "555-12"
+        знаходить номер "5551234567", а запит "5551234" — номер "(555) 123-4567".
+
+        Args:
+            query: Запит, що складається з цифр та символів "+-() "
+
+        Returns:
+            List[Record]: Список контактів у порядку адресної книги
+        """
+        digits = NON_DIGITS.sub("", query)
+        candidates = self._contact_index.candidates(digits)
+        names: Iterable[str] = self._contact_search_text
+        if candidates is not None:
+            # Ім'я на кшталт "(5-55)" містить запит, але не його цифри підряд,
+            # тому додаємо кандидатів і за самим запитом
+            name_candidates = self._contact_index.candidates(query) or []
+            names = self._contact_index.sort_keys({*candidates, *name_candidates})
+
+        results = []
+        for name in names:
+            name_folded, _, phone_digits = self._contact_search_text[name]
+            if digits in phone_digits or query in name_folded:
+                results.append(self.address_book.data[name])
+        return results
+
+    def get_all_contacts(self) -> ValuesView[Record]:
         """
         Отримує всі контакти з адресної книги.
 
+        Повертає представлення значень словника без копіювання: його можна
+        перебирати та отримувати len(), а зміни адресної книги одразу в ньому
+        відображаються. Для незалежної копії використовуйте list().
+
+        Returns:
+            ValuesView[Record]: Всі контакти у вигляді Record об'єктів
+        """
+        return self.address_book.data.values()
+
+    def get_contacts_page(self, offset: int, limit: int) -> List[Record]:
+        """
+        Отримує сторінку контактів без копіювання всієї адресної книги.
+
+        Args:
+            offset: Кількість контактів, які потрібно пропустити
+            limit: Максимальна кількість контактів на сторінці
+
         Returns:
-            List[Record]: Список всіх контактів у вигляді Record об'єктів
+            List[Record]: Контакти сторінки у порядку адресної книги
         """
-        return list(self.address_book.data.values())
+        return list(islice(self.address_book.data.values(), offset, offset + limit))
 
     def get_contact_by_name(self, name: str) -> Optional[Record]:
         """
@@ -245,8 +591,7 @@ class OperationsManager:
         Returns:
             Optional[Record]: Запис контакту якщо знайдено, None інакше
         """
-        result = self.address_book.find(name)
-        return result if isinstance(result, Record) else None
+        return self.address_book.find(name)
 
     def edit_contact(self, name: str, action: str, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -274,61 +619,123 @@ class OperationsManager:
         if not record:
             return {"success": False, "message": f"Contact '{name}' not found"}
 
-        try:
-            if action == "add_phone":
-                # Додаємо новий телефон
-                phone = kwargs.get("phone")
-                if not phone:
-                    return {"success": False, "message": "Phone number is required"}
-                record.add_phone(phone)
-                self.save_data()
-                return {
-                    "success": True,
-                    "message": f"Phone '{phone}' added successfully",
-                }
+        # Диспетчеризація через словник: одна операція пошуку замість ланцюжка
+        # порівнянь рядків, невідома дія відсікається одразу
+        handler = self._CONTACT_ACTIONS.get(action)
+        if handler is None:
+            return {"success": False, "message": f"Unknown action: {action}"}
 
-            elif action == "remove_phone":
-                # Видаляємо телефон
-                phone = kwargs.get("phone")
-                if not phone:
-                    return {"success": False, "message": "Phone number is required"}
-                record.remove_phone(phone)
-                self.save_data()
-                return {
-                    "success": True,
-                    "message": f"Phone '{phone}' removed successfully",
-                }
+        # Обов'язкові аргументи всіх дій перевіряються тут, в одному місці
+        missing = self._check_required_args(self._CONTACT_REQUIRED_ARGS, action, kwargs)
+        if missing is not None:
+            return missing
 
-            elif action == "change_phone":
-                # Змінюємо телефон
-                old_phone = kwargs.get("phone")
-                new_phone = kwargs.get("new_phone")
-                if not old_phone or not new_phone:
-                    return {
-                        "success": False,
-                        "message": "Both old and new phone numbers are required",
-                    }
-                record.edit_phone(old_phone, new_phone)
-                self.save_data()
-                return {
-                    "success": True,
-                    "message": f"Phone changed from '{old_phone}' to '{new_phone}'",
-                }
+        try:
+            return handler(self, record, kwargs)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
 
-            elif action == "add_birthday":
-                # Додаємо день народження
-                birthday = kwargs.get("birthday")
-                if not birthday:
-                    return {"success": False, "message": "Birthday is required"}
-                record.add_birthday(birthday)
-                self.save_data()
-                return {"success": True, "message": f"Birthday set to '{birthday}'"}
+    @staticmethod
+    def _check_required_args(
+        required_args: Dict[str, Tuple[Tuple[str, ...], str]],
+        action: str,
+        kwargs: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Перевіряє, що всі обов'язкові аргументи дії передані та не порожні.
 
-            else:
-                return {"success": False, "message": f"Unknown action: {action}"}
+        Args:
+            required_args: Таблиця обов'язкових аргументів дій
+            action: Дія для виконання
+            kwargs: Передані аргументи дії
 
-        except ValueError as e:
-            return {"success": False, "message": str(e)}
+        Returns:
+            Optional[Dict[str, Any]]: Результат з помилкою або None, якщо все гаразд
+        """
+        required = required_args.get(action)
+        if required is None:
+            return None
+        keys, message = required
+        for key in keys:
+            if not kwargs.get(key):
+                return {"success": False, "message": message}
+        return None
+
+    def _contact_add_phone(
+        self, record: Record, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Додає новий телефон до контакту (дія add_phone)."""
+        phone = kwargs["phone"]
+        had_phones = bool(record.phones)
+        record.add_phone(phone)
+        if not had_phones:
+            self._stats["contacts_with_phones"] += 1
+        self._index_contact(record)
+        self._mark_dirty(JOURNAL_CONTACT, record.name.value)
+        return {"success": True, "message": f"Phone '{phone}' added successfully"}
+
+    def _contact_remove_phone(
+        self, record: Record, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Видаляє телефон контакту (дія remove_phone)."""
+        phone = kwargs["phone"]
+        record.remove_phone(phone)
+        if not record.phones:
+            self._stats["contacts_with_phones"] -= 1
+        self._index_contact(record)
+        self._mark_dirty(JOURNAL_CONTACT, record.name.value)
+        return {"success": True, "message": f"Phone '{phone}' removed successfully"}
+
+    def _contact_change_phone(
+        self, record: Record, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Замінює телефон контакту на новий (дія change_phone)."""
+        old_phone, new_phone = kwargs["phone"], kwargs["new_phone"]
+        record.edit_phone(old_phone, new_phone)
+        self._index_contact(record)
+        self._mark_dirty(JOURNAL_CONTACT, record.name.value)
+        return {
+            "success": True,
+            "message": f"Phone changed from '{old_phone}' to '{new_phone}'",
+        }
+
+    def _contact_add_birthday(
+        self, record: Record, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Встановлює день народження контакту (дія add_birthday)."""
+        birthday = kwargs["birthday"]
+        had_birthday = record.birthday is not None
+        self._unindex_birthday(record)
+        try:
+            record.add_birthday(birthday)
+        finally:
+            # Повертаємо контакт в індекс навіть якщо дата виявилась невалідною
+            self._index_birthday(record)
+        if not had_birthday:
+            self._stats["contacts_with_birthdays"] += 1
+        self._mark_dirty(JOURNAL_CONTACT, record.name.value)
+        return {"success": True, "message": f"Birthday set to '{birthday}'"}
+
+    # Обов'язкові аргументи дій edit_contact: дія -> (аргументи, повідомлення)
+    _CONTACT_REQUIRED_ARGS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+        "add_phone": (("phone",), "Phone number is required"),
+        "remove_phone": (("phone",), "Phone number is required"),
+        "change_phone": (
+            ("phone", "new_phone"),
+            "Both old and new phone numbers are required",
+        ),
+        "add_birthday": (("birthday",), "Birthday is required"),
+    }
+
+    # Обробники дій edit_contact: дія -> метод (self, record, kwargs)
+    _CONTACT_ACTIONS: Dict[
+        str, Callable[["OperationsManager", Record, Dict[str, Any]], Dict[str, Any]]
+    ] = {
+        "add_phone": _contact_add_phone,
+        "remove_phone": _contact_remove_phone,
+        "change_phone": _contact_change_phone,
+        "add_birthday": _contact_add_birthday,
+    }
 
     def delete_contact(self, name: str) -> Dict[str, Any]:
         """
@@ -341,10 +748,21 @@ class OperationsManager:
             Dict[str, Any]: Результат операції з статусом та повідомленням
         """
         try:
+            record = self.address_book.find(name)
             # Видаляємо контакт з адресної книги
             self.address_book.delete(name)
+            self._contact_order.pop(name, None)
+            if self._contact_index_ready:
+                self._contact_index.remove(name)
+                self._contact_search_text.pop(name, None)
+            if record is not None:
+                self._unindex_birthday(record)
+                if record.birthday:
+                    self._stats["contacts_with_birthdays"] -= 1
+                if record.phones:
+                    self._stats["contacts_with_phones"] -= 1
             # Зберігаємо зміни в файл
-            self.save_data()
+            self._mark_dirty(JOURNAL_CONTACT, name)
             return {
                 "success": True,
                 "message": f"Contact '{name}' deleted successfully",
@@ -362,9 +780,19 @@ class OperationsManager:
         Returns:
             List[Dict[str, Any]]: Список контактів з інформацією про дні народження
         """
-        # Викликаємо метод адресної книги з параметром days
-        result = self.address_book.get_upcoming_birthdays(days)
-        return result if isinstance(result, list) else []
+        # Замість перебору всіх контактів переглядаємо лише дні вікна в індексі
+        # днів народження; порядок результатів відповідає порядку контактів
+        window = AddressBook.birthday_window(days)
+        names = [name for key in window for name in self._birthday_index.get(key, ())]
+
+        upcoming: List[Dict[str, Any]] = []
+        for name in sorted(names, key=self._contact_order.__getitem__):
+            birthday = self.address_book.data[name].birthday
+            if birthday is None:
+                continue
+            day = window[(birthday.date.month, birthday.date.day)]
+            upcoming.append(AddressBook.upcoming_birthday_entry(name, day))
+        return upcoming
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -380,31 +808,12 @@ class OperationsManager:
         Returns:
             Dict[str, Any]: Словник зі статистичними даними
         """
-        # Підраховуємо загальну кількість контактів та нотаток
-        contact_count = len(self.address_book.data)
-        note_count = len(self.notes_manager.data)
-
-        # Підраховуємо контакти з днями народження
-        contacts_with_birthdays = sum(
-            1 for record in self.address_book.data.values() if record.birthday
-        )
-
-        # Підраховуємо контакти з телефонами
-        contacts_with_phones = sum(
-            1 for record in self.address_book.data.values() if record.phones
-        )
-
-        # Підраховуємо нотатки з тегами
-        notes_with_tags = sum(
-            1 for note in self.notes_manager.data.values() if note.tags
-        )
-
+        # Лічильники підтримуються інкрементально, тож статистика не потребує
+        # проходу по всіх записах; загальні кількості беремо з len() за O(1)
         return {
-            "total_contacts": contact_count,
-            "total_notes": note_count,
-            "contacts_with_birthdays": contacts_with_birthdays,
-            "contacts_with_phones": contacts_with_phones,
-            "notes_with_tags": notes_with_tags,
+            "total_contacts": len(self.address_book.data),
+            "total_notes": len(self.notes_manager.data),
+            **self._stats,
         }
 
     # =====================================
@@ -434,9 +843,14 @@ class OperationsManager:
 
             # Створюємо нову нотатку через менеджер нотаток
             note_id = self.notes_manager.create_note(title, content, tags)
+            self._add_note_order(note_id)
+            self._index_note_tags(note_id, tags)
+            self._notes_search_buffer = None
+            if tags:
+                self._stats["notes_with_tags"] += 1
 
             # Зберігаємо дані в файл
-            save_success = self.save_data()
+            save_success = self._mark_dirty(JOURNAL_NOTE, note_id)
             if not save_success:
                 return {
                     "success": False,
@@ -466,8 +880,58 @@ class OperationsManager:
         Returns:
             Dict[str, Note]: Словник знайдених нотаток (ID -> Note)
         """
-        result = self.notes_manager.search_notes(query)
-        return result if isinstance(result, dict) else {}
+        query = query.casefold()
+        # Порожній запит або запит з роздільником буфера перевіряємо звичайним
+        # перебором, щоб збіг не перетнув межу між полями
+        if not query or "\x00" in query:
+            return self.notes_manager.search_notes(query)
+
+        if self._notes_search_buffer is None:
+            self._notes_search_buffer = self._build_notes_search_buffer()
+        buffer, offsets, note_ids = self._notes_search_buffer
+
+        # Один str.find проходить весь текст нотаток на рівні C замість
+        # перетворення регістру та перевірки кожної нотатки в циклі Python
+        results: Dict[str, Note] = {}
+        position = buffer.find(query)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            note_id = note_ids[index]
+            results[note_id] = self.notes_manager.data[note_id]
+            if index + 1 == len(offsets):
+                break
+            # Продовжуємо пошук з початку наступної нотатки
+            position = buffer.find(query, offsets[index + 1])
+        return results
+
+    def _build_notes_search_buffer(self) -> Tuple[str, List[int], List[str]]:
+        """
+        Будує спільний буфер тексту всіх нотаток для пошуку.
+
+        Регістр заголовка, змісту і тегів кожної нотатки зводиться через
+        casefold, після чого вони записуються в один рядок через роздільник "\\x00".
+
+        Returns:
+            Tuple[str, List[int], List[str]]: Буфер, зміщення початку кожної
+            нотатки в буфері та ID нотаток у тому ж порядку
+        """
+        parts: List[str] = []
+        offsets: List[int] = []
+        note_ids: List[str] = []
+        position = 0
+        for note_id, note in self.notes_manager.data.items():
+            text = "\x00".join(
+                [
+                    note.title.casefold(),
+                    note.content.casefold(),
+                    *(t.casefold() for t in note.tags),
+                ]
+            )
+            offsets.append(position)
+            note_ids.append(note_id)
+            parts.append(text)
+            position += len(text) + 1
+        return "\x00".join(parts), offsets, note_ids
 
     def get_all_notes(self) -> Dict[str, Note]:
         """
@@ -476,8 +940,7 @@ class OperationsManager:
         Returns:
             Dict[str, Note]: Словник всіх нотаток (ID -> Note)
         """
-        result = self.notes_manager.data
-        return result if isinstance(result, dict) else {}
+        return self.notes_manager.data
 
     def get_note_by_id(self, note_id: str) -> Optional[Note]:
         """
@@ -489,8 +952,7 @@ class OperationsManager:
         Returns:
             Optional[Note]: Об'єкт нотатки якщо знайдено, None інакше
         """
-        result = self.notes_manager.find_note(note_id)
-        return result if isinstance(result, Note) else None
+        return self.notes_manager.find_note(note_id)
 
     def edit_note(self, note_id: str, action: str, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -518,51 +980,91 @@ class OperationsManager:
         if not note:
             return {"success": False, "message": f"Note with ID '{note_id}' not found"}
 
-        try:
-            if action == "edit_title":
-                # Змінюємо заголовок
-                title = kwargs.get("title")
-                if not title:
-                    return {"success": False, "message": "Title is required"}
-                note.title = title
-                note.updated_at = datetime.now().isoformat()
-                self.save_data()
-                return {"success": True, "message": "Title updated successfully"}
-
-            elif action == "edit_content":
-                # Змінюємо зміст
-                content = kwargs.get("content")
-                if content is None:
-                    return {"success": False, "message": "Content is required"}
-                note.content = content
-                note.updated_at = datetime.now().isoformat()
-                self.save_data()
-                return {"success": True, "message": "Content updated successfully"}
-
-            elif action == "add_tag":
-                # Додаємо тег
-                tag = kwargs.get("tag")
-                if not tag:
-                    return {"success": False, "message": "Tag is required"}
-                note.add_tag(tag)
-                self.save_data()
-                return {"success": True, "message": f"Tag '{tag}' added successfully"}
-
-            elif action == "remove_tag":
-                # Видаляємо тег
-                tag = kwargs.get("tag")
-                if not tag:
-                    return {"success": False, "message": "Tag is required"}
-                note.remove_tag(tag)
-                self.save_data()
-                return {"success": True, "message": f"Tag '{tag}' removed successfully"}
-
-            else:
-                return {"success": False, "message": f"Unknown action: {action}"}
+        # Диспетчеризація через словник, як і в edit_contact
+        handler = self._NOTE_ACTIONS.get(action)
+        if handler is None:
+            return {"success": False, "message": f"Unknown action: {action}"}
 
+        missing = self._check_required_args(self._NOTE_REQUIRED_ARGS, action, kwargs)
+        if missing is not None:
+            return missing
+
+        try:
+            return handler(self, note_id, note, kwargs)
         except ValueError as e:
             return {"success": False, "message": str(e)}
 
+    def _note_edit_title(
+        self, note_id: str, note: Note, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Змінює заголовок нотатки (дія edit_title)."""
+        title = kwargs["title"]
+        note.title = title
+        note.updated_at = self._timestamp()
+        self._notes_search_buffer = None
+        self._mark_dirty(JOURNAL_NOTE, note_id)
+        return {"success": True, "message": "Title updated successfully"}
+
+    def _note_edit_content(
+        self, note_id: str, note: Note, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Змінює зміст нотатки (дія edit_content)."""
+        content = kwargs.get("content")
+        if content is None:
+            return {"success": False, "message": "Content is required"}
+        note.content = content
+        note.updated_at = self._timestamp()
+        self._notes_search_buffer = None
+        self._mark_dirty(JOURNAL_NOTE, note_id)
+        return {"success": True, "message": "Content updated successfully"}
+
+    def _note_add_tag(
+        self, note_id: str, note: Note, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Додає тег до нотатки (дія add_tag)."""
+        tag = kwargs["tag"]
+        had_tags = bool(note.tags)
+        note.add_tag(tag, self._timestamp())
+        if not had_tags and note.tags:
+            self._stats["notes_with_tags"] += 1
+        self._index_note_tags(note_id, note.tags)
+        self._notes_search_buffer = None
+        self._mark_dirty(JOURNAL_NOTE, note_id)
+        return {"success": True, "message": f"Tag '{tag}' added successfully"}
+
+    def _note_remove_tag(
+        self, note_id: str, note: Note, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Видаляє тег з нотатки (дія remove_tag)."""
+        tag = kwargs["tag"]
+        had_tags = bool(note.tags)
+        note.remove_tag(tag, self._timestamp())
+        if had_tags and not note.tags:
+            self._stats["notes_with_tags"] -= 1
+        self._unindex_note_tags(note_id, [tag.strip()])
+        self._notes_search_buffer = None
+        self._mark_dirty(JOURNAL_NOTE, note_id)
+        return {"success": True, "message": f"Tag '{tag}' removed successfully"}
+
+    # Обов'язкові аргументи дій edit_note: дія -> (аргументи, повідомлення).
+    # Зміст перевіряється в обробнику, бо порожній зміст є допустимим
+    _NOTE_REQUIRED_ARGS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+        "edit_title": (("title",), "Title is required"),
+        "add_tag": (("tag",), "Tag is required"),
+        "remove_tag": (("tag",), "Tag is required"),
+    }
+
+    # Обробники дій edit_note: дія -> метод (self, note_id, note, kwargs)
+    _NOTE_ACTIONS: Dict[
+        str,
+        Callable[["OperationsManager", str, Note, Dict[str, Any]], Dict[str, Any]],
+    ] = {
+        "edit_title": _note_edit_title,
+        "edit_content": _note_edit_content,
+        "add_tag": _note_add_tag,
+        "remove_tag": _note_remove_tag,
+    }
+
     def delete_note(self, note_id: str) -> Dict[str, Any]:
         """
         Видаляє нотатку за її унікальним ідентифікатором.
@@ -580,10 +1082,16 @@ class OperationsManager:
                 - success: булевий статус операції
                 - message: повідомлення про результат
         """
+        note = self.notes_manager.find_note(note_id)
         # Намагаємося видалити нотатку через менеджер нотаток
         if self.notes_manager.delete_note(note_id):
+            self._note_order.pop(note_id, None)
+            if note is not None and note.tags:
+                self._stats["notes_with_tags"] -= 1
+                self._unindex_note_tags(note_id, note.tags)
+            self._notes_search_buffer = None
             # Зберігаємо зміни після успішного видалення
-            self.save_data()
+            self._mark_dirty(JOURNAL_NOTE, note_id)
             return {"success": True, "message": "Note deleted successfully"}
         else:
             return {
@@ -606,10 +1114,13 @@ class OperationsManager:
                 Ключ - ID нотатки, значення - об'єкт Note.
                 Повертає пустий словник якщо нотатки не знайдені.
         """
-        # Викликаємо метод пошуку за тегом в менеджері нотаток
-        result = self.notes_manager.get_notes_by_tag(tag)
-        # Повертаємо результат або пустий словник
-        return result if isinstance(result, dict) else {}
+        # Беремо ідентифікатори нотаток з індексу тегів замість перебору всіх нотаток
+        # і впорядковуємо лише знайдені за порядковими номерами нотаток
+        note_ids = self._tag_index.get(tag.strip().lower(), set())
+        return {
+            note_id: self.notes_manager.data[note_id]
+            for note_id in sorted(note_ids, key=self._note_order.__getitem__)
+        }
 
     def global_search(self, query: str) -> Dict[str, Any]:
         """
@@ -630,12 +1141,21 @@ class OperationsManager:
                 - contacts: List[Record] - знайдені контакти
                 - notes: Dict[str, Note] - знайдені нотатки
         """
-        return {
-            # Шукаємо в контактах
-            "contacts": self.search_contacts(query),
-            # Шукаємо в нотатках
-            "notes": self.search_notes(query),
-        }
+        # Повторні запити (автодоповнення, уточнення від AI) беремо з кешу
+        key = query.casefold()
+        cached = self._search_cache.get(key)
+        if cached is None:
+            # Шукаємо в контактах та нотатках
+            cached = (self.search_contacts(query), self.search_notes(query))
+            self._search_cache[key] = cached
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+
+        contacts, notes = cached
+        # Повертаємо копії, щоб зміни результатів викликачем не псували кеш
+        return {"contacts": list(contacts), "notes": dict(notes)}
 
     # View operations
     def view_contact_details(self, name: str) -> Dict[str, Any]:
@@ -696,14 +1216,15 @@ class OperationsManager:
         if not note:
             return {"success": False, "message": f"Note with ID '{note_id}' not found"}
 
-        # Формуємо детальну інформацію про нотатку
+        # Формуємо детальну інформацію про нотатку; теги копіюються, щоб
+        # зміна результату не зачіпала саму нотатку
         return {
             "success": True,
             "note": {
                 "id": note_id,
                 "title": note.title,
                 "content": note.content,
-                "tags": note.tags,
+                "tags": list(note.tags),
                 "created_at": note.created_at,
                 "updated_at": note.updated_at,
             },
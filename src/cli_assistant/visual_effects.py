@@ -7,16 +7,14 @@
 
 import random
 import time
-from typing import List, Optional
+from functools import lru_cache
+from itertools import cycle
+from typing import List, Optional, Tuple, Union
 
-import pyfiglet  # type: ignore
-from art import text2art  # type: ignore
-from halo import Halo  # type: ignore
 from rich import box
 from rich.align import Align
 from rich.columns import Columns
 from rich.console import Console
-from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
@@ -33,6 +31,31 @@ from rich.text import Text
 from .animated_effects import AnimatedEffects
 
 
+@lru_cache(maxsize=64)
+def _figlet_title(text: str, font: str) -> str:
+    """Рендерить ASCII-заголовок через pyfiglet (результат кешується)."""
+    # pyfiglet імпортується лише тут: його завантаження помітно сповільнює старт
+    import pyfiglet  # type: ignore
+
+    try:
+        return str(pyfiglet.figlet_format(text, font=font))
+    except Exception:
+        # Якщо шрифт не знайдено, використовується стандартний
+        return str(pyfiglet.figlet_format(text))
+
+
+@lru_cache(maxsize=64)
+def _art_title(text: str, font: str) -> str:
+    """Рендерить художній заголовок через art (результат кешується)."""
+    from art import text2art  # type: ignore
+
+    try:
+        return str(text2art(text, font=font))
+    except Exception:
+        # Якщо шрифт не знайдено, використовується стандартний
+        return str(text2art(text))
+
+
 class VisualEffects:
     """Клас для створення гарних візуальних ефектів у терміналі."""
 
@@ -91,19 +114,11 @@ class VisualEffects:
 
     def create_ascii_title(self, text: str, font: str = "big") -> str:
         """Створює ASCII-заголовок великими літерами."""
-        try:
-            return str(pyfiglet.figlet_format(text, font=font))
-        except Exception:
-            # Якщо шрифт не знайдено, використовується стандартний
-            return str(pyfiglet.figlet_format(text))
+        return _figlet_title(text, font)
 
     def create_art_title(self, text: str, font: str = "block") -> str:
         """Створює художній ASCII-заголовок."""
-        try:
-            return str(text2art(text, font=font))
-        except Exception:
-            # Якщо шрифт не знайдено, використовується стандартний
-            return str(text2art(text))
+        return _art_title(text, font)
 
     def display_animated_title(self, title: str, subtitle: str = "") -> None:
         """Відображає анімований заголовок з ефектами."""
@@ -131,9 +146,8 @@ class VisualEffects:
             "bright_magenta",
         ]
 
-        for i, line in enumerate(lines):
+        for line, color in zip(lines, cycle(color_sequence)):
             if line.strip():  # Якщо рядок не порожній
-                color = color_sequence[i % len(color_sequence)]
                 colored_lines.append(Text(line, style=f"bold {color}"))
             else:
                 colored_lines.append(Text(line))
@@ -164,6 +178,8 @@ class VisualEffects:
         self, text: str = "Loading...", duration: float = 0.8
     ) -> None:
         """Відображає гарну анімацію завантаження."""
+        from halo import Halo  # type: ignore
+
         spinner_styles = [
             "dots",
             "line",
@@ -204,14 +220,11 @@ class VisualEffects:
 
     def create_rainbow_text(self, text: str) -> Text:
         """Створює текст з райдужними кольорами."""
-        rainbow_text = Text()
         colors = ["red", "bright_red", "yellow", "green", "cyan", "blue", "magenta"]
 
-        for i, char in enumerate(text):
-            color = colors[i % len(colors)]
-            rainbow_text.append(char, style=f"bold {color}")
-
-        return rainbow_text
+        return Text.assemble(
+            *((char, f"bold {color}") for char, color in zip(text, cycle(colors)))
+        )
 
     def display_success_message(self, message: str) -> None:
         """Відображає повідомлення про успіх з ефектами."""
@@ -263,10 +276,9 @@ class VisualEffects:
         """Відображає анімацію святкування."""
         celebration_symbols = ["🎉", "🎊", "✨", "🌟", "💫", "🎆", "🎇"]
 
-        for _ in range(2):  # Швидша анімація
-            symbols = " ".join(random.choices(celebration_symbols, k=10))
-            self.console.print(Align.center(Text(symbols, style="bright_yellow")))
-            time.sleep(0.2)  # Швидший таймінг
+        # Два рядки символів виводимо одним викликом, без пауз між ними
+        lines = [" ".join(random.choices(celebration_symbols, k=10)) for _ in range(2)]
+        self.console.print(Align.center(Text("\n".join(lines), style="bright_yellow")))
 
     def create_fancy_table_style(self, table: Table) -> Table:
         """Застосовує гарний стиль до таблиці."""
@@ -281,31 +293,37 @@ class VisualEffects:
         chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
         width = self.console.size.width
         height = self.console.size.height
+        rows = max(height - 5, 0)
 
         with Live(auto_refresh=False) as live:
             for _ in range(int(duration * 10)):
-                lines = []
-                for _ in range(height - 5):
-                    line = "".join(random.choices(chars, k=width))
-                    lines.append(Text(line, style="bright_green"))
-
-                live.update(Align.center("\n".join(str(line) for line in lines)))
+                # Генеруємо символи всього кадру одним викликом і ріжемо на рядки
+                frame = "".join(random.choices(chars, k=width * rows))
+                # Один Text на кадр замість окремого Text для кожного рядка
+                frame_text = Text(
+                    "\n".join(
+                        frame[start : start + width]
+                        for start in range(0, len(frame), width)
+                    ),
+                    style="bright_green",
+                )
+
+                live.update(Align.center(frame_text))
                 live.refresh()
                 time.sleep(0.1)
 
     def create_neon_text(self, text: str, color: str = "bright_magenta") -> Text:
         """Створює неоновий ефект для тексту."""
-        neon_text = Text()
-
         # Додаємо 'світіння' через повторення з різною інтенсивністю
         shadow_colors = ["dim " + color, color, "bold " + color]
 
+        # Кожен рядок має один стиль, тому додаємо його одним фрагментом
+        parts: List[Union[str, Tuple[str, str]]] = []
         for shadow_color in shadow_colors:
-            for char in text:
-                neon_text.append(char, style=shadow_color)
-            neon_text.append("\n")
+            parts.append((text, shadow_color))
+            parts.append("\n")
 
-        return neon_text
+        return Text.assemble(*parts)
 
     def display_startup_sequence(self, app_name: str = "CLI Assistant") -> None:
         """Відображає гарну послідовність запуску додатку з анімаціями."""
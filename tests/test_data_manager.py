@@ -16,6 +16,7 @@ from .test_data_manager_basic import TestDataManagerBasic
 from .test_data_manager_contacts import TestDataManagerContacts
 from .test_data_manager_error_handling import TestDataManagerErrorHandling
 from .test_data_manager_file_ops import TestDataManagerFileOps
+from .test_data_manager_journal import TestDataManagerJournal
 from .test_data_manager_notes import TestDataManagerNotes
 
 # Re-export test classes for pytest discovery
@@ -25,4 +26,5 @@ __all__ = [
     "TestDataManagerNotes",
     "TestDataManagerFileOps",
     "TestDataManagerErrorHandling",
+    "TestDataManagerJournal",
 ]
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+DataManager journal tests - append-only change journal and compaction.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli_assistant.database.contact_models import AddressBook, Record
+from cli_assistant.database.data_manager import (
+    JOURNAL_CONTACT,
+    JOURNAL_NOTE,
+    DataManager,
+)
+from cli_assistant.database.note_models import NotesManager
+
+
+class TestDataManagerJournal:
+    """Test DataManager change journal."""
+
+    def setup_method(self):
+        """Setup test environment with temporary files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.contacts_file = os.path.join(self.temp_dir, "test_contacts.json")
+        self.notes_file = os.path.join(self.temp_dir, "test_notes.json")
+        self.dm = DataManager(self.contacts_file, self.notes_file)
+
+    def teardown_method(self):
+        """Clean up test files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @pytest.mark.unit
+    def test_journal_replayed_on_load(self):
+        """Test that journaled changes are applied on top of the snapshot."""
+        book = AddressBook()
+        book.add_record(Record("John"))
+        notes_manager = NotesManager()
+        first_id = notes_manager.create_note("First", "Content")
+        self.dm.save_data(book, notes_manager)
+
+        record = Record("Jane")
+        record.add_phone("1234567890")
+        book.add_record(record)
+        book.delete("John")
+        second_id = notes_manager.create_note("Second", "More", ["tag"])
+        changes = [
+            (JOURNAL_CONTACT, "Jane"),
+            (JOURNAL_CONTACT, "John"),
+            (JOURNAL_NOTE, second_id),
+        ]
+        assert self.dm.append_journal(book, notes_manager, changes) is True
+        assert self.dm.get_journal_size() == 3
+
+        loaded_book, loaded_notes = DataManager(
+            self.contacts_file, self.notes_file
+        ).load_data()
+
+        assert list(loaded_book.data) == ["Jane"]
+        assert loaded_book.find("Jane").phones[0].value == "1234567890"
+        assert set(loaded_notes.data) == {first_id, second_id}
+        assert loaded_notes.find_note(second_id).tags == ["tag"]
+        assert loaded_notes._next_id == notes_manager._next_id
+
+    @pytest.mark.unit
+    def test_save_data_clears_journal(self):
+        """Test that a full snapshot removes the journal."""
+        book = AddressBook()
+        book.add_record(Record("John"))
+        notes_manager = NotesManager()
+
+        self.dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "John")])
+        assert self.dm.journal_filepath.exists()
+
+        assert self.dm.save_data(book, notes_manager) is True
+        assert not self.dm.journal_filepath.exists()
+        assert self.dm.get_journal_size() == 0
+
+    def _journal_both_then_edit(self):
+        """Journal a contact and a note, then change both in memory."""
+        book = AddressBook()
+        record = Record("John")
+        record.add_phone("1111111111")
+        book.add_record(record)
+        notes_manager = NotesManager()
+        note_id = notes_manager.create_note("Title", "old")
+        self.dm.save_data(book, notes_manager)
+        self.dm.append_journal(
+            book, notes_manager, [(JOURNAL_CONTACT, "John"), (JOURNAL_NOTE, note_id)]
+        )
+
+        record.edit_phone("1111111111", "2222222222")
+        notes_manager.find_note(note_id).update_content("new")
+        return book, notes_manager, note_id
+
+    def _reload(self):
+        """Load data through a fresh DataManager."""
+        return DataManager(self.contacts_file, self.notes_file).load_data()
+
+    @pytest.mark.unit
+    def test_save_contacts_drops_contact_journal_entries(self):
+        """Test that older journaled contacts do not override a newer snapshot."""
+        book, notes_manager, note_id = self._journal_both_then_edit()
+
+        assert self.dm.save_contacts(book) is True
+        assert self.dm.get_journal_size() == 1
+
+        loaded_book, loaded_notes = self._reload()
+        assert [p.value for p in loaded_book.find("John").phones] == ["2222222222"]
+        assert loaded_notes.find_note(note_id).content == "old"
+
+    @pytest.mark.unit
+    def test_save_notes_drops_note_journal_entries(self):
+        """Test that older journaled notes do not override a newer snapshot."""
+        book, notes_manager, note_id = self._journal_both_then_edit()
+
+        assert self.dm.save_notes(notes_manager) is True
+        assert self.dm.get_journal_size() == 1
+
+        loaded_book, loaded_notes = self._reload()
+        assert loaded_notes.find_note(note_id).content == "new"
+        assert [p.value for p in loaded_book.find("John").phones] == ["1111111111"]
+
+    @pytest.mark.unit
+    def test_save_data_without_notes_keeps_note_entries(self):
+        """Test that saving only contacts drops only contact journal entries."""
+        book, notes_manager, note_id = self._journal_both_then_edit()
+        notes_manager.find_note(note_id).update_content("old")
+
+        assert self.dm.save_data(book, None) is True
+        assert self.dm.get_journal_size() == 1
+
+        loaded_book, loaded_notes = self._reload()
+        assert [p.value for p in loaded_book.find("John").phones] == ["2222222222"]
+        assert loaded_notes.find_note(note_id).content == "old"
+
+    @pytest.mark.unit
+    def test_journal_compaction(self):
+        """Test that a long journal is merged into a snapshot."""
+        self.dm.JOURNAL_COMPACTION_THRESHOLD = 2
+        book = AddressBook()
+        notes_manager = NotesManager()
+
+        for name in ["A", "B", "C"]:
+            book.add_record(Record(name))
+            self.dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, name)])
+
+        assert not self.dm.journal_filepath.exists()
+        assert list(self.dm.load_contacts().data) == ["A", "B", "C"]
+
+    @pytest.mark.unit
+    def test_truncated_journal_entry_ignored(self):
+        """Test that a partially written last entry does not break loading."""
+        book = AddressBook()
+        book.add_record(Record("John"))
+        notes_manager = NotesManager()
+        self.dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "John")])
+
+        with open(self.dm.journal_filepath, "a", encoding="utf-8") as f:
+            f.write('{"type": "contact", "key": "Ja')
+
+        assert list(self.dm.load_contacts().data) == ["John"]
+
+    @pytest.mark.unit
+    def test_append_after_truncated_entry(self):
+        """Test that entries journaled after a torn write survive a reload."""
+        book = AddressBook()
+        book.add_record(Record("A"))
+        notes_manager = NotesManager()
+        self.dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "A")])
+
+        with open(self.dm.journal_filepath, "a", encoding="utf-8") as f:
+            f.write('{"type": "contact", "key": "Ja')
+
+        # Simulate a restart: a new instance appends to the damaged journal
+        dm = DataManager(self.contacts_file, self.notes_file)
+        book, notes_manager = dm.load_data()
+        book.add_record(Record("B"))
+        assert dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "B")])
+
+        loaded = DataManager(self.contacts_file, self.notes_file).load_contacts()
+        assert list(loaded.data) == ["A", "B"]
+
+    @pytest.mark.unit
+    def test_entry_without_trailing_newline_kept(self):
+        """Test that a complete entry missing only its newline is not lost."""
+        book = AddressBook()
+        book.add_record(Record("A"))
+        book.add_record(Record("B"))
+        notes_manager = NotesManager()
+        self.dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "A")])
+        content = self.dm.journal_filepath.read_text(encoding="utf-8")
+        self.dm.journal_filepath.write_text(content.rstrip("\n"), encoding="utf-8")
+
+        dm = DataManager(self.contacts_file, self.notes_file)
+        dm.append_journal(book, notes_manager, [(JOURNAL_CONTACT, "B")])
+
+        loaded = DataManager(self.contacts_file, self.notes_file).load_contacts()
+        assert list(loaded.data) == ["A", "B"]
+
+    @pytest.mark.unit
+    def test_load_data_reads_journal_once(self):
+        """Test that loading both stores reads the journal a single time."""
+        book = AddressBook()
+        book.add_record(Record("John"))
+        notes_manager = NotesManager()
+        note_id = notes_manager.create_note("Title", "Content")
+        self.dm.append_journal(
+            book,
+            notes_manager,
+            [(JOURNAL_CONTACT, "John"), (JOURNAL_NOTE, note_id)],
+        )
+
+        dm = DataManager(self.contacts_file, self.notes_file)
+        with patch.object(dm, "_read_journal", wraps=dm._read_journal) as read:
+            loaded_book, loaded_notes = dm.load_data()
+            assert dm.get_journal_size() == 2
+
+        assert read.call_count == 1
+        assert list(loaded_book.data) == ["John"]
+        assert list(loaded_notes.data) == [note_id]
@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 import os
 import tempfile
 from datetime import date, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -101,6 +102,7 @@ class TestPhone:
         """Test phone creation with formatting characters."""
         phone = Phone("(123) 456-7890")
         assert phone.value == "(123) 456-7890"
+        assert phone.digits == "1234567890"
 
     @pytest.mark.unit
     def test_phone_validation_exactly_10_digits(self):
@@ -150,6 +152,17 @@ class TestPhone:
             ):
                 Phone(phone_str)
 
+    @pytest.mark.unit
+    def test_phone_validation_non_ascii_digits(self):
+        """Test that non-ASCII Unicode digits are not accepted as phone digits."""
+        invalid_phones = ["١٢٣٤٥٦٧٨٩٠", "１２３４５６７８９０"]
+
+        for phone_str in invalid_phones:
+            with pytest.raises(
+                ValueError, match="Phone number must contain exactly 10 digits"
+            ):
+                Phone(phone_str)
+
     @pytest.mark.unit
     def test_phone_validation_empty_string(self):
         """Test phone validation with empty string."""
@@ -169,6 +182,15 @@ class TestRecord:
         assert record.name.value == "John"
         assert len(record.phones) == 0
 
+    @pytest.mark.unit
+    def test_record_uses_slots(self):
+        """Test that record does not allow arbitrary attributes."""
+        record = Record("John")
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.email = "john@example.com"
+
     @pytest.mark.unit
     def test_add_phone_valid(self):
         """Test adding valid phone to record."""
@@ -243,6 +265,7 @@ class TestRecord:
         found_phone = record.find_phone("1112223333")
         assert found_phone is not None
         assert found_phone.value == "1112223333"
+        assert found_phone.digits == "1112223333"
 
     @pytest.mark.unit
     def test_edit_phone_non_existing(self):
@@ -306,6 +329,28 @@ class TestRecord:
         assert found_phone is not None
         assert found_phone.value == "(123) 456-7890"
 
+    @pytest.mark.unit
+    def test_find_phone_after_edit(self):
+        """Test that edited phone is found by new number and not by old one."""
+        record = Record("John")
+        record.add_phone("1234567890")
+
+        record.edit_phone("123-456-7890", "(111) 222-3333")
+
+        assert record.find_phone("1234567890") is None
+        found_phone = record.find_phone("1112223333")
+        assert found_phone is not None
+        assert found_phone.value == "(111) 222-3333"
+
+    @pytest.mark.unit
+    def test_add_phone_duplicate_with_formatting(self):
+        """Test that duplicate detection ignores phone formatting."""
+        record = Record("John")
+        record.add_phone("1234567890")
+
+        with pytest.raises(ValueError, match="already exists for John"):
+            record.add_phone("(123) 456-7890")
+
     @pytest.mark.unit
     def test_str_representation_no_phones(self):
         """Test string representation with no phones."""
@@ -443,6 +488,18 @@ class TestAddressBook:
         assert len(all_records) == 0
         assert all_records == {}
 
+    @pytest.mark.unit
+    def test_get_all_records_is_read_only_view(self):
+        """Test that get_all_records returns a live read-only view."""
+        book = AddressBook()
+        all_records = book.get_all_records()
+
+        with pytest.raises(TypeError):
+            all_records["John"] = Record("John")
+
+        book.add_record(Record("John"))
+        assert "John" in all_records
+
 
 class TestIntegration:
     """Integration tests for the complete Address Book system."""
@@ -603,6 +660,20 @@ class TestBirthday:
         with pytest.raises(ValueError, match="Invalid date format. Use DD.MM.YYYY"):
             Birthday("30.02.1990")
 
+    @pytest.mark.unit
+    def test_birthday_creation_single_digit_day_and_month(self):
+        """Test that unpadded day and month are accepted like strptime does."""
+        birthday = Birthday("1.2.1990")
+        assert birthday.date == date(1990, 2, 1)
+        assert birthday.value == "1.2.1990"
+
+    @pytest.mark.unit
+    def test_birthday_creation_rejects_short_year_and_trailing_text(self):
+        """Test that two-digit years and trailing characters are rejected."""
+        for value in ("01.02.90", "01.02.1990 ", "01.02.19901"):
+            with pytest.raises(ValueError, match="Invalid date format"):
+                Birthday(value)
+
     @pytest.mark.unit
     def test_birthday_str_representation(self):
         """Test string representation of birthday."""
@@ -938,6 +1009,43 @@ class TestAddressBookBirthdays:
             assert upcoming[0]["name"] == "John"
             assert upcoming[0]["congratulation_date"] == monday.strftime("%Y.%m.%d")
 
+    @pytest.mark.unit
+    def test_upcoming_birthday_entry_weekend_shift(self):
+        """Test that weekend birthdays move to the following Monday."""
+        saturday = date(2024, 6, 15)
+        sunday = date(2024, 6, 16)
+        friday = date(2024, 6, 14)
+
+        saturday_entry = AddressBook.upcoming_birthday_entry("John", saturday)
+        sunday_entry = AddressBook.upcoming_birthday_entry("Jane", sunday)
+        friday_entry = AddressBook.upcoming_birthday_entry("Bob", friday)
+
+        assert saturday_entry["birthday_date"] == "2024.06.15"
+        assert saturday_entry["congratulation_date"] == "2024.06.17"
+        assert sunday_entry["congratulation_date"] == "2024.06.17"
+        assert friday_entry["congratulation_date"] == "2024.06.14"
+
+    @pytest.mark.unit
+    def test_get_upcoming_birthdays_leap_day_in_common_year(self):
+        """Test that a Feb 29 birthday is celebrated on Feb 28 in common years."""
+
+        class FixedDate(date):
+            @classmethod
+            def today(cls):
+                return cls(2025, 2, 25)
+
+        book = AddressBook()
+        john = Record("John")
+        john.add_birthday("29.02.2000")
+        book.add_record(john)
+
+        with patch("cli_assistant.database.contact_models.date", FixedDate):
+            upcoming = book.get_upcoming_birthdays()
+
+        assert len(upcoming) == 1
+        assert upcoming[0]["birthday_date"] == "2025.02.28"
+        assert upcoming[0]["congratulation_date"] == "2025.02.28"
+
     @pytest.mark.unit
     def test_get_upcoming_birthdays_multiple_contacts(self):
         """Test get_upcoming_birthdays with multiple contacts."""
@@ -46,6 +46,17 @@ class TestNote:
         assert note.tags == []
         assert note.created_at is not None
 
+    @pytest.mark.unit
+    def test_note_timestamp_format(self):
+        """Test that timestamps keep the 'YYYY-MM-DD HH:MM:SS.ffffff' format."""
+        note = Note("Title")
+        note.update_content("Updated")
+
+        for timestamp in (note.created_at, note.updated_at):
+            assert timestamp is not None
+            parsed = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S.%f")
+            assert parsed.strftime("%Y-%m-%d %H:%M:%S.%f") == timestamp
+
     @pytest.mark.unit
     def test_note_creation_empty_title_error(self):
         """Test that empty title raises ValueError."""
@@ -98,6 +109,27 @@ class TestNote:
         note.add_tag("NEW_TAG")
         assert note.tags.count("new_tag") == 1  # Should not add duplicate
 
+    @pytest.mark.unit
+    def test_note_add_tags(self):
+        """Test adding several tags at once skips duplicates and empty tags."""
+        note = Note("Test", "Content", ["work"])
+
+        note.add_tags(["WORK", "Python", " ", "python", "docs"])
+
+        assert note.tags == ["work", "python", "docs"]
+        assert note.has_tag("docs")
+        assert note.updated_at is not None
+
+    @pytest.mark.unit
+    def test_note_add_tags_without_changes(self):
+        """Test adding only existing tags leaves the update timestamp unset."""
+        note = Note("Test", "Content", ["work"])
+
+        note.add_tags(["Work", ""])
+
+        assert note.tags == ["work"]
+        assert note.updated_at is None
+
     @pytest.mark.unit
     def test_note_remove_tag(self):
         """Test removing tags from note."""
@@ -117,6 +149,35 @@ class TestNote:
         assert note.has_tag("Programming")
         assert not note.has_tag("JavaScript")
 
+    @pytest.mark.unit
+    def test_note_remove_tag_case_insensitive(self):
+        """Test removing tag ignores case and updates membership checks."""
+        note = Note("Test", "Content", ["Python", "Programming"])
+
+        note.remove_tag("PYTHON")
+
+        assert note.tags == ["Programming"]
+        assert not note.has_tag("python")
+        note.add_tag("python")
+        assert note.tags == ["Programming", "python"]
+
+    @pytest.mark.unit
+    def test_note_has_tag_after_from_typed_dict(self):
+        """Test tag lookup works for notes restored from TypedDict."""
+        data: NoteData = {
+            "title": "Test Note",
+            "content": "Test content",
+            "tags": ["Work"],
+            "created_at": "2024-01-01 12:00:00",
+            "updated_at": None,
+        }
+
+        note = Note.from_typed_dict(data)
+
+        assert note.has_tag("work")
+        note.add_tag("WORK")
+        assert note.tags == ["Work"]
+
     @pytest.mark.unit
     def test_note_search_in_content(self):
         """Test searching within note content."""
@@ -146,6 +207,15 @@ class TestNote:
         assert "created_at" in data
         assert "updated_at" in data
 
+    @pytest.mark.unit
+    def test_note_uses_slots(self):
+        """Test that note does not allow arbitrary attributes."""
+        note = Note("Test", "Content")
+
+        assert not hasattr(note, "__dict__")
+        with pytest.raises(AttributeError):
+            note.priority = "high"
+
     @pytest.mark.unit
     def test_note_from_typed_dict(self):
         """Test creating note from TypedDict."""
@@ -318,6 +388,42 @@ class TestNotesManager:
         recent_ids = list(recent.keys())
         assert id3 in recent_ids  # Updated note should be included
 
+    @pytest.mark.unit
+    def test_get_recent_notes_order_and_limit(self):
+        """Test that recent notes are ordered by latest timestamp and limited."""
+        manager = NotesManager()
+        test_data: Dict[str, NoteData] = {
+            "note_0001": {
+                "title": "Old",
+                "content": "",
+                "tags": [],
+                "created_at": "2024-01-01 12:00:00.000000",
+                "updated_at": "2024-01-05 12:00:00.000000",
+            },
+            "note_0002": {
+                "title": "Oldest",
+                "content": "",
+                "tags": [],
+                "created_at": "2024-01-02 12:00:00.000000",
+                "updated_at": None,
+            },
+            "note_0003": {
+                "title": "Newest",
+                "content": "",
+                "tags": [],
+                "created_at": "2024-01-06 12:00:00.000000",
+                "updated_at": None,
+            },
+        }
+        manager.from_typed_dict(test_data)
+
+        assert list(manager.get_recent_notes(2)) == ["note_0003", "note_0001"]
+        assert list(manager.get_recent_notes(10)) == [
+            "note_0003",
+            "note_0001",
+            "note_0002",
+        ]
+
     @pytest.mark.unit
     def test_to_typed_dict(self):
         """Test converting manager to typed dict."""
@@ -366,6 +472,30 @@ class TestNotesManager:
         assert manager.data["note_0002"].title == "Test Note 2"
         assert manager._next_id == 3  # Should be set to max + 1
 
+    @pytest.mark.unit
+    def test_from_typed_dict_ignores_non_numeric_ids(self):
+        """Test ID counter skips IDs without a plain numeric suffix."""
+        manager = NotesManager()
+        note_data: NoteData = {
+            "title": "Test Note",
+            "content": "Content",
+            "tags": [],
+            "created_at": "2024-01-01 12:00:00",
+            "updated_at": None,
+        }
+
+        manager.from_typed_dict(
+            {
+                "note_0005": note_data,
+                "note_abc": note_data,
+                "note_²": note_data,
+                "custom_9": note_data,
+            }
+        )
+
+        assert len(manager.data) == 4
+        assert manager._next_id == 6
+
 
 class TestNotesIntegration:
     """Integration tests for notes system."""
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Test Suite for OperationsManager
+
+Tests covering the incremental state kept by the operations layer:
+- Contact, note and tag searches matching a naive scan after changes
+- Statistics counters after contact and note edits
+- Search and view cache invalidation
+- Batched saves through the change journal
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli_assistant.database.data_manager import DataManager
+from cli_assistant.operations_manager import OperationsManager
+
+
+class TestOperationsManager:
+    """Test cases for OperationsManager indexes, counters and caches."""
+
+    def setup_method(self):
+        """Create a fresh OperationsManager working in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        OperationsManager._instance = None
+        OperationsManager._initialized = False
+        self.ops = OperationsManager()
+
+    def teardown_method(self):
+        """Reset the singleton and clean up test files."""
+        OperationsManager._instance = None
+        OperationsManager._initialized = False
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _naive_contact_search(self, query):
+        """Return names of contacts matching query by a plain scan."""
+        query = query.casefold()
+        return [
+            record.name.value
+            for record in self.ops.address_book.data.values()
+            if query in record.name.value.casefold()
+            or any(query in phone.value for phone in record.phones)
+        ]
+
+    def _naive_note_search(self, query):
+        """Return IDs of notes matching query by a plain scan."""
+        return [
+            note_id
+            for note_id, note in self.ops.notes_manager.data.items()
+            if note.search_in_content(query)
+        ]
+
+    def _naive_tag_search(self, tag):
+        """Return IDs of notes having tag by a plain scan."""
+        return [
+            note_id
+            for note_id, note in self.ops.notes_manager.data.items()
+            if note.has_tag(tag)
+        ]
+
+    def _assert_searches_match_scan(self):
+        """Check every search against a plain scan of the current data."""
+        for query in ["jo", "John", "ann", "Ann-Marie", "xyz", "123", "4567", "555"]:
+            found = [r.name.value for r in self.ops.search_contacts(query)]
+            assert found == self._naive_contact_search(query), query
+        for query in ["py", "Python", "guide", "work", "missing"]:
+            assert list(self.ops.search_notes(query)) == self._naive_note_search(
+                query
+            ), query
+        for tag in ["work", "python", "docs"]:
+            assert list(self.ops.search_notes_by_tag(tag)) == self._naive_tag_search(
+                tag
+            ), tag
+
+    def _expected_statistics(self):
+        """Compute statistics by a plain scan of the current data."""
+        contacts = self.ops.address_book.data.values()
+        notes = self.ops.notes_manager.data.values()
+        return {
+            "total_contacts": len(contacts),
+            "total_notes": len(notes),
+            "contacts_with_birthdays": sum(1 for r in contacts if r.birthday),
+            "contacts_with_phones": sum(1 for r in contacts if r.phones),
+            "notes_with_tags": sum(1 for n in notes if n.tags),
+        }
+
+    def _populate(self):
+        """Add a few contacts and notes; return the note IDs."""
+        self.ops.add_contact("John", ["1234567890"], "15.05.1990")
+        self.ops.add_contact("Johnny", ["5551234567"])
+        self.ops.add_contact("Ann-Marie")
+        work_id = self.ops.add_note("Python guide", "Read the docs", ["work"])[
+            "note_id"
+        ]
+        docs_id = self.ops.add_note("Shopping", "Milk", ["docs", "Work"])["note_id"]
+        return work_id, docs_id
+
+    @pytest.mark.unit
+    def test_searches_match_naive_scan_after_changes(self):
+        """Test that indexed searches stay in sync with the data after edits."""
+        work_id, docs_id = self._populate()
+        self._assert_searches_match_scan()
+
+        self.ops.edit_contact(
+            "Johnny", "change_phone", phone="5551234567", new_phone="1112223333"
+        )
+        self.ops.edit_contact("Ann-Marie", "add_phone", phone="4445556677")
+        self.ops.edit_contact("John", "remove_phone", phone="1234567890")
+        self.ops.edit_note(work_id, "edit_title", title="Java notes")
+        self.ops.edit_note(docs_id, "edit_content", content="Python tutorial")
+        self.ops.edit_note(docs_id, "add_tag", tag="python")
+        self.ops.edit_note(work_id, "remove_tag", tag="WORK")
+        self._assert_searches_match_scan()
+
+        self.ops.delete_contact("John")
+        self.ops.delete_note(docs_id)
+        self.ops.add_contact("Joanna", ["1234567000"])
+        self._assert_searches_match_scan()
+
+    @pytest.mark.unit
+    def test_search_notes_by_tag_keeps_insertion_order(self):
+        """Test that tag search returns notes in insertion order, not sorted IDs."""
+        self.ops.notes_manager._next_id = 9999
+        first_id = self.ops.add_note("First", "", ["work"])["note_id"]
+        second_id = self.ops.add_note("Second", "", ["work"])["note_id"]
+
+        assert (first_id, second_id) == ("note_9999", "note_10000")
+        assert list(self.ops.search_notes_by_tag("work")) == [first_id, second_id]
+
+    @pytest.mark.unit
+    def test_search_notes_by_tag_orders_by_note_after_tag_edits(self):
+        """Test that adding a tag later does not move the note to the end."""
+        first_id = self.ops.add_note("First", "")["note_id"]
+        second_id = self.ops.add_note("Second", "", ["work"])["note_id"]
+
+        self.ops.edit_note(first_id, "add_tag", tag="work")
+        assert list(self.ops.search_notes_by_tag("work")) == [first_id, second_id]
+
+        self.ops.edit_note(first_id, "remove_tag", tag="work")
+        self.ops.edit_note(first_id, "add_tag", tag="Work")
+        assert list(self.ops.search_notes_by_tag("work")) == [first_id, second_id]
+
+    @pytest.mark.unit
+    def test_statistics_after_edits(self):
+        """Test that incremental counters match a plain scan after edits."""
+        work_id, docs_id = self._populate()
+        assert self.ops.get_statistics() == self._expected_statistics()
+
+        self.ops.edit_contact("Ann-Marie", "add_phone", phone="4445556677")
+        self.ops.edit_contact("Ann-Marie", "add_birthday", birthday="01.01.2000")
+        self.ops.edit_contact("John", "add_birthday", birthday="02.02.1992")
+        self.ops.edit_contact("Johnny", "remove_phone", phone="5551234567")
+        self.ops.edit_note(work_id, "remove_tag", tag="work")
+        self.ops.edit_note(docs_id, "add_tag", tag="extra")
+        assert self.ops.get_statistics() == self._expected_statistics()
+
+        self.ops.delete_contact("John")
+        self.ops.delete_note(docs_id)
+        assert self.ops.get_statistics() == self._expected_statistics()
+
+    @pytest.mark.unit
+    def test_statistics_unchanged_by_failed_edits(self):
+        """Test that rejected edits do not move the counters."""
+        self._populate()
+
+        self.ops.edit_contact("Ann-Marie", "add_phone", phone="123")
+        self.ops.edit_contact("Ann-Marie", "add_birthday", birthday="31.02.2000")
+        self.ops.add_contact("John", ["1112223333"])
+        assert self.ops.get_statistics() == self._expected_statistics()
+
+    @pytest.mark.unit
+    def test_search_cache_invalidated_on_change(self):
+        """Test that cached global search results are dropped after a change."""
+        self._populate()
+        first = self.ops.global_search("jo")
+        assert [r.name.value for r in first["contacts"]] == ["John", "Johnny"]
+        assert self.ops._search_cache
+
+        self.ops.add_contact("Joanna")
+
+        assert not self.ops._search_cache
+        second = self.ops.global_search("jo")
+        assert [r.name.value for r in second["contacts"]] == [
+            "John",
+            "Johnny",
+            "Joanna",
+        ]
+
+    @pytest.mark.unit
+    def test_view_details_reflect_changes(self):
+        """Test that details show edits without altering earlier results."""
+        work_id, _ = self._populate()
+        john = self.ops.view_contact_details("John")
+        note = self.ops.view_note_details(work_id)
+
+        self.ops.edit_contact("John", "add_phone", phone="1112223333")
+        self.ops.edit_note(work_id, "edit_title", title="Renamed")
+
+        assert self.ops.view_contact_details("John")["contact"]["phones"] == [
+            "1234567890",
+            "1112223333",
+        ]
+        assert john["contact"]["phones"] == ["1234567890"]
+        assert self.ops.view_note_details(work_id)["note"]["title"] == "Renamed"
+        assert note["note"]["title"] == "Python guide"
+
+    @pytest.mark.unit
+    def test_view_results_do_not_share_note_data(self):
+        """Test that changing a returned view result does not alter the note."""
+        note_id, _ = self._populate()
+
+        first = self.ops.view_note_details(note_id)
+        first["note"]["tags"].append("changed")
+        first["note"]["title"] = "Changed"
+
+        second = self.ops.view_note_details(note_id)
+        assert second["note"]["tags"] == ["work"]
+        assert second["note"]["title"] == "Python guide"
+
+    @pytest.mark.unit
+    def test_operation_results_serialize_to_json(self):
+        """Test that operation results round-trip through json.dumps."""
+        note_id, _ = self._populate()
+        results = [
+            self.ops.add_note("Another", "Text", ["tag"]),
+            self.ops.edit_note(note_id, "add_tag", tag="json"),
+            self.ops.edit_contact("Nobody", "add_phone", phone="1234567890"),
+            self.ops.view_contact_details("John"),
+            self.ops.view_note_details(note_id),
+            self.ops.delete_note(note_id),
+        ]
+
+        for result in results:
+            assert isinstance(result, dict)
+            assert json.loads(json.dumps(result)) == result
+
+    @pytest.mark.unit
+    def test_batch_writes_single_flush(self):
+        """Test that a batch journals all its changes with one write."""
+        with patch.object(
+            self.ops.data_manager,
+            "append_journal",
+            wraps=self.ops.data_manager.append_journal,
+        ) as append_journal:
+            with self.ops.batch():
+                self.ops.add_contact("John", ["1234567890"])
+                self.ops.edit_contact("John", "add_birthday", birthday="15.05.1990")
+                note_id = self.ops.add_note("Call John", "")["note_id"]
+                assert append_journal.call_count == 0
+                assert len(self.ops._pending) == 2
+
+        assert append_journal.call_count == 1
+        assert not self.ops._pending
+        assert self.ops.data_manager.get_journal_size() == 2
+
+        book, notes_manager = DataManager().load_data()
+        assert book.find("John").birthday.value == "15.05.1990"
+        assert notes_manager.find_note(note_id).title == "Call John"
+
+    @pytest.mark.unit
+    def test_batch_uses_one_timestamp_for_all_note_edits(self):
+        """Test that every note edit in a batch gets the same timestamp format."""
+        first_id, second_id = self._populate()
+
+        with self.ops.batch():
+            self.ops.edit_note(first_id, "edit_title", title="Renamed")
+            self.ops.edit_note(first_id, "add_tag", tag="new")
+            self.ops.edit_note(second_id, "edit_content", content="Bread")
+            self.ops.edit_note(second_id, "remove_tag", tag="docs")
+
+        first = self.ops.get_note_by_id(first_id)
+        second = self.ops.get_note_by_id(second_id)
+        assert first.updated_at == second.updated_at
+        assert re.fullmatch(
+            r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}", first.updated_at
+        )
+
+    @pytest.mark.unit
+    def test_note_edit_timestamp_format_outside_batch(self):
+        """Test that edits outside a batch use the note timestamp format."""
+        note_id, _ = self._populate()
+
+        self.ops.edit_note(note_id, "edit_content", content="Changed")
+
+        updated_at = self.ops.get_note_by_id(note_id).updated_at
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}", updated_at)
+
+    @pytest.mark.unit
+    def test_phone_query_matches_digits_ignoring_formatting(self):
+        """Test that phone-shaped queries compare digits, not formatting."""
+        self.ops.add_contact("Plain", ["5551234567"])
+        self.ops.add_contact("Formatted", ["(555) 987-6543"])
+        self.ops.add_contact("Other", ["1112223333"])
+
+        def names(query):
+            return [r.name.value for r in self.ops.search_contacts(query)]
+
+        # Formatted queries match unformatted numbers
+        assert names("555-12") == ["Plain"]
+        assert names("(555) 123") == ["Plain"]
+        # Unformatted queries match formatted numbers
+        assert names("5559876") == ["Formatted"]
+        assert names("555") == ["Plain", "Formatted"]
+        assert names("+1 (111) 222") == []
+        assert names("222-3333") == ["Other"]
+        assert names("999") == []
+
+    @pytest.mark.unit
+    def test_phone_query_still_matches_names(self):
+        """Test that phone-shaped queries also match the same text in names."""
+        self.ops.add_contact("Office (555)", ["1112223333"])
+        self.ops.add_contact("Home", ["5550001111"])
+
+        found = [r.name.value for r in self.ops.search_contacts("(555)")]
+
+        assert found == ["Office (555)", "Home"]
+
+    @pytest.mark.unit
+    def test_upcoming_birthdays_in_address_book_order(self):
+        """Test upcoming birthdays follow contact order without the search index."""
+        today = date.today()
+
+        def birthday(days_ahead):
+            return (today + timedelta(days=days_ahead)).replace(year=2000)
+
+        self.ops.add_contact("Later", birthday=birthday(3).strftime("%d.%m.%Y"))
+        self.ops.add_contact("NoBirthday")
+        self.ops.add_contact("Sooner", birthday=birthday(1).strftime("%d.%m.%Y"))
+        self.ops.add_contact("Removed", birthday=birthday(2).strftime("%d.%m.%Y"))
+        self.ops.delete_contact("Removed")
+        self.ops.add_contact("Newest", birthday=birthday(2).strftime("%d.%m.%Y"))
+
+        upcoming = self.ops.get_upcoming_birthdays(7)
+
+        assert [entry["name"] for entry in upcoming] == ["Later", "Sooner", "Newest"]
+        assert not self.ops._contact_index_ready
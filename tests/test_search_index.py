@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Trigram Search Index
+
+Tests covering the inverted trigram index used to narrow substring searches:
+- Trigram extraction
+- Candidate lookup for long and short queries
+- Re-indexing and removal of keys
+- Stable ordering of candidates
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli_assistant.database.search_index import TrigramIndex
+
+
+class TestTrigramIndex:
+    """Test cases for TrigramIndex class."""
+
+    @pytest.mark.unit
+    def test_trigrams(self):
+        """Test splitting text into trigrams."""
+        assert TrigramIndex.trigrams("john") == {"joh", "ohn"}
+        assert TrigramIndex.trigrams("jo") == set()
+
+    @pytest.mark.unit
+    def test_candidates_match_substring(self):
+        """Test that candidates include every key containing the query."""
+        index = TrigramIndex()
+        index.add("John", ["john", "1234567890"])
+        index.add("Johnny", ["johnny"])
+        index.add("Jane", ["jane", "5555555555"])
+
+        assert index.candidates("ohn") == ["John", "Johnny"]
+        assert index.candidates("456") == ["John"]
+        assert index.candidates("xyz") == []
+
+    @pytest.mark.unit
+    def test_candidates_short_query(self):
+        """Test that short queries are not served by the index."""
+        index = TrigramIndex()
+        index.add("John", ["john"])
+
+        assert index.candidates("jo") is None
+        assert index.candidates("") is None
+
+    @pytest.mark.unit
+    def test_reindex_replaces_texts_and_keeps_order(self):
+        """Test that re-adding a key replaces its texts but keeps its position."""
+        index = TrigramIndex()
+        index.add("John", ["john", "1234567890"])
+        index.add("Jane", ["jane", "1234567890"])
+
+        index.add("John", ["john", "5555555555"])
+
+        assert index.candidates("1234") == ["Jane"]
+        assert index.candidates("555") == ["John"]
+        index.add("John", ["john", "1234567890"])
+        assert index.candidates("1234") == ["John", "Jane"]
+
+    @pytest.mark.unit
+    def test_remove(self):
+        """Test removing keys from the index."""
+        index = TrigramIndex()
+        index.add("John", ["john"])
+        index.add("Johnny", ["johnny"])
+
+        index.remove("John")
+        index.remove("Unknown")
+
+        assert index.candidates("john") == ["Johnny"]
+
+    @pytest.mark.unit
+    def test_sort_keys(self):
+        """Test ordering arbitrary keys by insertion order."""
+        index = TrigramIndex()
+        index.add("John", ["john"])
+        index.add("Jane", ["jane"])
+        index.add("Bob", ["bob"])
+
+        assert index.sort_keys({"Bob", "John"}) == ["John", "Bob"]
+        assert index.sort_keys([]) == []